@@ -78,6 +78,11 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Tests create tables straight from the current models instead of replaying
+        # every migration; run `makemigrations --check` to catch model/migration drift.
+        'TEST': {
+            'MIGRATE': False,
+        },
     }
 }
 
@@ -271,11 +271,7 @@ class Command(BaseCommand):
             status=GameStatus.LOBBY,
             max_players=4
         )
-        player = Player.objects.create(
-            user=users[0],
-            display_name=users[0].username,
-            is_ai=False
-        )
+        player = Player.for_user(users[0])
         LobbyPlayer.objects.create(
             game=game,
             player=player,
@@ -295,11 +291,7 @@ class Command(BaseCommand):
             max_players=4
         )
         for i, user in enumerate(users):
-            player = Player.objects.create(
-                user=user,
-                display_name=user.username,
-                is_ai=False
-            )
+            player = Player.for_user(user)
             LobbyPlayer.objects.create(
                 game=game,
                 player=player,
@@ -329,11 +321,7 @@ class Command(BaseCommand):
         # Create players
         players = []
         for i, user in enumerate(users):
-            player = Player.objects.create(
-                user=user,
-                display_name=user.username,
-                is_ai=False
-            )
+            player = Player.for_user(user)
             LobbyPlayer.objects.create(
                 game=game,
                 player=player,
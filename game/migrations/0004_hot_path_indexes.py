@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0003_game_mode'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gameboardtilestate',
+            index=models.Index(fields=['game', 'owner'], name='tilestate_game_owner_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lobbyplayer',
+            index=models.Index(fields=['game', 'is_ready'], name='lobbyplayer_game_ready_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='turn',
+            index=models.Index(fields=['game', '-round_number', '-created_at'], name='turn_game_latest_idx'),
+        ),
+    ]
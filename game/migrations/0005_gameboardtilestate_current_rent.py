@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:57
+
+from django.db import migrations, models
+
+
+def backfill_current_rent(apps, schema_editor):
+    GameBoardTileState = apps.get_model("game", "GameBoardTileState")
+    City = apps.get_model("game", "City")
+    rent_fields = ["rent_base", "rent_house_1", "rent_house_2", "rent_house_3", "rent_house_4", "rent_hotel"]
+
+    states = list(
+        GameBoardTileState.objects.filter(owner__isnull=False, mortgaged=False)
+        .select_related("board_position", "board_tile")
+    )
+    tile_ids = {s.board_tile.tile_id for s in states if s.board_tile_id and not s.board_position_id}
+    cities_by_tile = {c.tile_id: c for c in City.objects.filter(tile_id__in=tile_ids)}
+    cities_by_id = {
+        c.id: c for c in City.objects.filter(
+            id__in={s.board_position.city_id for s in states if s.board_position_id}
+        )
+    }
+    for state in states:
+        if state.board_position_id:
+            city = cities_by_id.get(state.board_position.city_id)
+        else:
+            city = cities_by_tile.get(state.board_tile.tile_id) if state.board_tile_id else None
+        if city:
+            state.current_rent = getattr(city, rent_fields[min(max(state.houses, 0), 5)])
+    GameBoardTileState.objects.bulk_update(states, ["current_rent"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gameboardtilestate',
+            name='current_rent',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_current_rent, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0005_gameboardtilestate_current_rent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='turn',
+            name='die1',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='turn',
+            name='die2',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='actionlog',
+            index=models.Index(fields=['game', 'action_type'], name='actionlog_game_type_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:01
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0006_turn_dice_actionlog_type_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lobbyplayer',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='lobbyplayer',
+            index=models.Index(fields=['game', 'updated_at'], name='lobbyplayer_game_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0007_lobbyplayer_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='actionlog',
+            index=models.Index(fields=['game', 'created_at'], name='actionlog_game_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0008_actionlog_game_created_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bid',
+            index=models.Index(fields=['board_tile_state', '-amount'], name='bid_tilestate_amount_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0009_bid_tilestate_amount_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['game', 'created_at'], name='chatmessage_game_created_idx'),
+        ),
+    ]
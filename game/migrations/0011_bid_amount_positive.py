@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0010_chatmessage_game_created_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='bid',
+            constraint=models.CheckConstraint(condition=models.Q(('amount__gt', 0)), name='bid_amount_positive'),
+        ),
+    ]
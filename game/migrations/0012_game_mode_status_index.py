@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0011_bid_amount_positive'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['mode', 'status', '-created_at'], name='game_mode_status_idx'),
+        ),
+    ]
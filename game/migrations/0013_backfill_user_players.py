@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:52
+
+from django.conf import settings
+from django.db import migrations
+
+
+def backfill_user_players(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    Player = apps.get_model("game", "Player")
+    Player.objects.bulk_create(
+        (
+            Player(user_id=user_id, display_name=username)
+            for user_id, username in User.objects.filter(player__isnull=True).values_list("id", "username")
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0012_game_mode_status_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_user_players, migrations.RunPython.noop),
+    ]
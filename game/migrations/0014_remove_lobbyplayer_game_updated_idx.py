@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-16 00:09
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('game', '0013_backfill_user_players'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lobbyplayer',
+            name='lobbyplayer_game_updated_idx',
+        ),
+    ]
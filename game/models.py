@@ -1,11 +1,17 @@
 # models.py
 import uuid
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db import models, transaction
+from django.db.models import Case, Count, F, Max, Prefetch, Q, Value, When
+from django.db.models.functions import Now
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.crypto import get_random_string
 from django.core.validators import MinValueValidator
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 User = settings.AUTH_USER_MODEL
@@ -41,6 +47,14 @@ class TileType(models.TextChoices):
     VACATION = "VACATION", "Vacation"
     CUSTOM = "CUSTOM", "Custom"
 
+# value -> label maps, so per-row display lookups are a single dict access
+_GAME_STATUS_LABELS = dict(GameStatus.choices)
+_GAME_MODE_LABELS = dict(GameMode.choices)
+_TILE_TYPE_LABELS = dict(TileType.choices)
+
+# Statuses of a game that has started and not yet finished.
+ACTIVE_GAME_STATUSES = frozenset({GameStatus.ACTIVE, GameStatus.PAUSED})
+
 def generate_public_id(length=6):
     # short, human-friendly id like 'ha83sZ'
     return get_random_string(length=length).lower()
@@ -70,7 +84,7 @@ class Board(models.Model):
     def __str__(self):
         return f"{self.name} ({self.size}x{self.size})"
 
-    @property
+    @cached_property
     def total_tiles(self) -> int:
         return self.size * self.size
 
@@ -107,41 +121,8 @@ class Board(models.Model):
             special_pos = self.default_special_positions()
             total_positions = self.total_tiles
             
-            # Get or create canonical special tiles
-            special_tiles = {
-                "start": Tile.objects.get_or_create(
-                    title="Start",
-                    tile_type=TileType.START,
-                    defaults={
-                        "description": "Collect salary when passing",
-                        "action": {"type": "collect", "amount": 200}
-                    }
-                )[0],
-                "prison": Tile.objects.get_or_create(
-                    title="Prison/Visiting",
-                    tile_type=TileType.JAIL,
-                    defaults={
-                        "description": "Just visiting or in jail",
-                        "action": {"type": "jail_check"}
-                    }
-                )[0],
-                "vacation": Tile.objects.get_or_create(
-                    title="Vacation",
-                    tile_type=TileType.VACATION,
-                    defaults={
-                        "description": "Take a vacation",
-                        "action": {"type": "rest"}
-                    }
-                )[0],
-                "go_to_prison": Tile.objects.get_or_create(
-                    title="Go to Prison",
-                    tile_type=TileType.GO_TO_JAIL,
-                    defaults={
-                        "description": "Go directly to prison",
-                        "action": {"type": "send_to_jail", "target_position": special_pos["prison"]}
-                    }
-                )[0],
-            }
+            # Canonical special tiles are shared by every board (cached in-process)
+            special_tiles = get_canonical_special_tiles(prison_position=special_pos["prison"])
             
             # Get existing positions for this board
             existing_positions = set(
@@ -172,6 +153,26 @@ class Board(models.Model):
             if positions_to_create:
                 BoardPosition.objects.bulk_create(positions_to_create)
 
+    def generate_tiles(self, defs, batch_size=500):
+        """
+        Create Tiles and place them on this board in two multi-row INSERTs.
+        Each def is a dict of Tile fields plus the target "position", e.g.
+        {"position": 3, "title": "Chance", "tile_type": TileType.CHANCE}.
+        Returns the created BoardPosition objects.
+        """
+        defs = [dict(d) for d in defs]
+        positions = [d.pop("position") for d in defs]
+        for pos in positions:
+            if not 0 <= pos < self.total_tiles:
+                raise ValidationError(f"Position {pos} is outside board range 0..{self.total_tiles - 1}.")
+
+        with transaction.atomic():
+            tiles = Tile.objects.bulk_create([Tile(**d) for d in defs], batch_size=batch_size)
+            return BoardPosition.objects.bulk_create(
+                [BoardPosition(board=self, position=pos, tile=tile) for pos, tile in zip(positions, tiles)],
+                batch_size=batch_size,
+            )
+
 class Tile(models.Model):
     """
     A canonical tile entity representing non-property tiles (START, JAIL, CHANCE, etc.).
@@ -191,6 +192,77 @@ class Tile(models.Model):
     def __str__(self):
         return f"{self.title} [{self.tile_type}]"
 
+    def get_tile_type_display(self):
+        return _TILE_TYPE_LABELS.get(self.tile_type, self.tile_type)
+
+# In-process cache of the canonical special tiles, keyed like default_special_positions().
+_canonical_cache = {}
+
+CANONICAL_TILE_TYPES = frozenset({TileType.START, TileType.JAIL, TileType.VACATION, TileType.GO_TO_JAIL})
+
+def get_canonical_special_tiles(prison_position=0):
+    """
+    Return the canonical START/JAIL/VACATION/GO_TO_JAIL tiles, creating them if needed.
+    They are global singletons, so after the first lookup they are served from memory.
+    The cache is only filled once the surrounding transaction commits, so a rolled-back
+    get_or_create never leaves a dangling Tile in it.
+    """
+    if _canonical_cache:
+        return dict(_canonical_cache)
+    tiles = {
+        "start": Tile.objects.get_or_create(
+            title="Start",
+            tile_type=TileType.START,
+            defaults={
+                "description": "Collect salary when passing",
+                "action": {"type": "collect", "amount": 200}
+            }
+        )[0],
+        "prison": Tile.objects.get_or_create(
+            title="Prison/Visiting",
+            tile_type=TileType.JAIL,
+            defaults={
+                "description": "Just visiting or in jail",
+                "action": {"type": "jail_check"}
+            }
+        )[0],
+        "vacation": Tile.objects.get_or_create(
+            title="Vacation",
+            tile_type=TileType.VACATION,
+            defaults={
+                "description": "Take a vacation",
+                "action": {"type": "rest"}
+            }
+        )[0],
+        "go_to_prison": Tile.objects.get_or_create(
+            title="Go to Prison",
+            tile_type=TileType.GO_TO_JAIL,
+            defaults={
+                "description": "Go directly to prison",
+                "action": {"type": "send_to_jail", "target_position": prison_position}
+            }
+        )[0],
+    }
+    transaction.on_commit(lambda: _canonical_cache.update(tiles))
+    return tiles
+
+LOBBY_BOARDS_CACHE_KEY = "lobby:boards"
+
+def get_lobby_boards(timeout=60):
+    """
+    All boards ordered by name, for the lobby's board picker. Boards only change from
+    the admin, so the list is kept in the cache and dropped whenever a Board is saved or
+    deleted. Like the canonical tiles, it is only cached once the surrounding transaction
+    commits, so rows from a rolled-back transaction never end up in it.
+    The drop only reaches other server processes through a shared cache backend; with
+    the default per-process LocMemCache they keep their copy until the short timeout.
+    """
+    boards = cache.get(LOBBY_BOARDS_CACHE_KEY)
+    if boards is None:
+        boards = list(Board.objects.order_by("name"))
+        transaction.on_commit(lambda: cache.set(LOBBY_BOARDS_CACHE_KEY, boards, timeout))
+    return boards
+
 # This model maps a position on a Board to either a Tile or a City.
 class BoardPosition(models.Model):
     """
@@ -230,8 +302,6 @@ class BoardPosition(models.Model):
 
     def clean(self):
         """Validate that exactly one of (tile, city) is set."""
-        from django.core.exceptions import ValidationError
-        
         if self.tile is None and self.city is None:
             raise ValidationError("BoardPosition must have either a tile or a city set.")
         if self.tile is not None and self.city is not None:
@@ -246,6 +316,14 @@ class BoardPosition(models.Model):
         content = self.tile.title if self.tile else (self.city.tile.title if self.city else "Empty")
         return f"{self.board.name} @ {self.position} -> {content}"
 
+class BoardTileManager(models.Manager):
+    """
+    Joins board and tile by default - __str__ needs both, so list pages would otherwise
+    issue two extra SELECTs per row.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related("board", "tile")
+
 # Legacy model - kept for backwards compatibility during migration
 class BoardTile(models.Model):
     """
@@ -263,6 +341,9 @@ class BoardTile(models.Model):
     # optional: allow tile instance overrides (e.g., custom action for this board placement)
     override_action = models.JSONField(default=dict, blank=True)
 
+    objects = BoardTileManager()
+    raw_objects = models.Manager()  # no joins; for bulk writes and updates
+
     class Meta:
         unique_together = ("board", "position")
         ordering = ["position"]
@@ -273,6 +354,13 @@ class BoardTile(models.Model):
 # -------------------------------------
 # Tile subtype: City (property)
 # -------------------------------------
+class CityManager(models.Manager):
+    """
+    Joins the underlying tile by default since __str__ reads its title.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related("tile")
+
 class City(models.Model):
     """
     City (property) data attached to a Tile. Use OneToOne so a Tile can optionally be a City.
@@ -292,12 +380,29 @@ class City(models.Model):
     hotel_cost = models.PositiveIntegerField(default=50)
     color_group = models.CharField(max_length=40, blank=True, help_text="Group e.g., Boardwalk-set")
 
+    objects = CityManager()
+    raw_objects = models.Manager()  # no joins; for bulk writes and updates
+
     def __str__(self):
         return f"City: {self.tile.title} ({self.base_price})"
 
+    def rent_for(self, houses: int) -> int:
+        """
+        Rent owed for this city at the given development level (0..4 houses, 5 = hotel).
+        """
+        if houses <= 0:
+            return self.rent_base
+        if houses >= 5:
+            return self.rent_hotel
+        return getattr(self, f"rent_house_{houses}")
+
 # -------------------------------------
 # Game session + lobby + players
 # -------------------------------------
+class GameQuerySet(models.QuerySet):
+    def in_progress(self):
+        return self.filter(status__in=ACTIVE_GAME_STATUSES)
+
 class Game(models.Model):
     """
     A game session. Public id is a short string (human friendly) while 'uuid' is a true UUID.
@@ -320,18 +425,62 @@ class Game(models.Model):
     # serialized game state (optional): speed vs normalization tradeoff
     state = models.JSONField(default=dict, blank=True)
 
+    objects = GameQuerySet.as_manager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # public lobby: filter(mode=..., status=...).order_by("-created_at")
+            models.Index(fields=["mode", "status", "-created_at"], name="game_mode_status_idx"),
+        ]
 
     def __str__(self):
         return f"Game {self.public_id} ({self.status})"
 
+    def get_status_display(self):
+        return _GAME_STATUS_LABELS.get(self.status, self.status)
+
+    def get_mode_display(self):
+        return _GAME_MODE_LABELS.get(self.mode, self.mode)
+
+    @property
+    def is_in_progress(self) -> bool:
+        return self.status in ACTIVE_GAME_STATUSES
+
     # -------------- Lobby & Ready/Start logic --------------
+    def _prefetched_lobby_players(self):
+        """
+        Return the prefetched lobby players, or None if the caller didn't prefetch them.
+        When they are prefetched (game_detail does, with select_related("player") so it
+        can also find the current user's seat), the lobby helpers below are answered
+        from memory. Listings that only need the seat count, like the public lobby,
+        annotate(active_players_count=Count("lobby_players")) instead.
+        """
+        return getattr(self, "_prefetched_objects_cache", {}).get("lobby_players")
+
+    @cached_property
+    def active_players_count(self) -> int:
+        """
+        Number of seated players, memoized on the instance so repeated template/helper
+        calls within one request share a single COUNT. Dropped by refresh_from_db() and
+        whenever a LobbyPlayer for this same Game instance is saved or deleted.
+        Listings that only need the count can fill it in up front with
+        annotate(active_players_count=Count("lobby_players")).
+        """
+        prefetched = self._prefetched_lobby_players()
+        if prefetched is not None:
+            return len(prefetched)
+        return self.lobby_players.count()
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop("active_players_count", None)
+        super().refresh_from_db(*args, **kwargs)
+
     def get_active_players_count(self):
         """
         Get the number of active players in the game.
         """
-        return self.lobby_players.count()
+        return self.active_players_count
     
     def is_full(self):
         """
@@ -362,45 +511,90 @@ class Game(models.Model):
     def players(self):
         return self.lobby_players.select_related("player").order_by("seat_index")
 
+    def _has_unready_players(self) -> bool:
+        """
+        True if any seat is not ready. Uses EXISTS (stops at the first match) rather than
+        loading seats, or the prefetched seats when available.
+        """
+        prefetched = self._prefetched_lobby_players()
+        if prefetched is not None:
+            return any(not lp.is_ready for lp in prefetched)
+        return self.lobby_players.filter(is_ready=False).exists()
+
     def all_players_ready(self) -> bool:
         """
         Quick check — doesn't change state; just inspects players.
         """
-        players = self.players()
-        if not players.exists():
+        if self.active_players_count == 0:
             return False
-        return all([p.is_ready for p in players])
+        return not self._has_unready_players()
+
+    def _is_starter(self, user) -> bool:
+        if user is None:
+            return False
+        return not self.owner_id or getattr(user, "pk", None) == self.owner_id
 
     def can_start(self, user) -> bool:
         """
         Only owner can start and only when all players are ready and at least 2 players present.
         """
-        if user is None:
+        if not self._is_starter(user):
+            return False
+        if self.active_players_count < 2:
             return False
-        if self.owner and getattr(user, "pk", None) != getattr(self.owner, "pk", None):
+        return not self._has_unready_players()
+
+    def poll_can_start(self, user) -> bool:
+        """
+        can_start() for clients polling the waiting room: one aggregate counts the seats
+        and the ready seats together. Nothing is cached or memoized, so every poll sees
+        the seats as they are, however they were written.
+        """
+        if not self._is_starter(user):
             return False
-        player_count = self.players().count()
-        return player_count >= 2 and self.all_players_ready()
+        probe = self.lobby_players.aggregate(seats=Count("id"), ready=Count("id", filter=Q(is_ready=True)))
+        return probe["seats"] >= 2 and probe["ready"] == probe["seats"]
 
     @transaction.atomic
     def start(self, user):
         """
         Start the game: set status, timestamp, initialize per-game property states,
-        determine turn order, and set first player. This should be an atomic operation.
+        determine turn order, and set first player, all in one transaction.
         """
         if not self.can_start(user):
             raise PermissionError("Owner required and all players must be ready with min players.")
         # initialize state only once
         if self.status != GameStatus.LOBBY:
             raise ValueError("Game already started or finished.")
+        started_at = timezone.now()
+        # claim the start with a conditional UPDATE of just the lifecycle columns, so
+        # of two concurrent starts only one gets past here
+        if not Game.objects.filter(pk=self.pk, status=GameStatus.LOBBY).update(
+            status=GameStatus.ACTIVE, started_at=started_at
+        ):
+            raise ValueError("Game already started or finished.")
         # snapshot board layout into game-specific BoardTileState (see below)
         self.initialize_board_state()
         # choose turn order (current simple: seat_index ascending)
-        first_player = self.players().order_by("seat_index").first()
-        Turn.objects.create(game=self, current_player=first_player.player, round_number=1)
+        first_player_id = self.lobby_players.order_by("seat_index").values_list("player_id", flat=True).first()
+        Turn.objects.create(game=self, current_player_id=first_player_id, round_number=1)
         self.status = GameStatus.ACTIVE
-        self.started_at = timezone.now()
-        self.save()
+        self.started_at = started_at
+
+    def finish(self) -> bool:
+        """
+        Mark an in-progress game finished with one conditional UPDATE; finished_at is set
+        by the database clock. Returns False if the game wasn't in progress (e.g. it was
+        already finished), so concurrent callers can't finish it twice.
+        """
+        updated = Game.objects.filter(pk=self.pk, status__in=ACTIVE_GAME_STATUSES).update(
+            status=GameStatus.FINISHED,
+            finished_at=Now(),
+        )
+        if updated:
+            self.status = GameStatus.FINISHED
+            self.refresh_from_db(fields=["finished_at"])
+        return bool(updated)
 
     def initialize_board_state(self):
         """
@@ -414,26 +608,28 @@ class Game(models.Model):
         if GameBoardTileState.objects.filter(game=self).exists():
             return
 
-        # Try new schema first (BoardPosition)
-        board_positions = BoardPosition.objects.filter(board=self.board).order_by("position")
-        if board_positions.exists():
+        # Try new schema first (BoardPosition); only ids and positions are needed
+        board_positions = list(
+            BoardPosition.objects.filter(board=self.board).order_by("position").values_list("id", "position")
+        )
+        if board_positions:
             states = []
-            for bp in board_positions:
+            for bp_id, position in board_positions:
                 states.append(GameBoardTileState(
                     game=self, 
-                    board_position=bp, 
-                    position=bp.position
+                    board_position_id=bp_id, 
+                    position=position
                 ))
             GameBoardTileState.objects.bulk_create(states)
         else:
             # Fallback to legacy schema (BoardTile)
-            board_tiles = BoardTile.objects.filter(board=self.board).order_by("position")
+            board_tiles = BoardTile.raw_objects.filter(board=self.board).order_by("position").values_list("id", "position")
             states = []
-            for bt in board_tiles:
+            for bt_id, position in board_tiles:
                 states.append(GameBoardTileState(
                     game=self, 
-                    board_tile=bt, 
-                    position=bt.position
+                    board_tile_id=bt_id, 
+                    position=position
                 ))
             GameBoardTileState.objects.bulk_create(states)
 
@@ -453,6 +649,26 @@ class Player(models.Model):
     def __str__(self):
         return self.display_name or f"Player-{self.pk}"
 
+    @classmethod
+    def for_user(cls, user):
+        """
+        The user's persistent Player. One is created when the User is (see ensure_player),
+        so this is normally a single SELECT; it is only inserted here as a fallback.
+        """
+        player = cls.objects.filter(user=user).order_by("pk").first()
+        if player is None:
+            player = cls.objects.create(user=user, display_name=user.get_username())
+        return player
+
+class LobbyPlayerReadyManager(models.Manager):
+    """
+    Narrow rows for readiness UIs and the Game lobby helpers: only the columns those
+    read. Touching any other field (cash, position, ...) on these instances triggers a
+    per-instance SELECT, so don't use it for anything that renders more than readiness.
+    """
+    def get_queryset(self):
+        return super().get_queryset().only("id", "game_id", "player_id", "seat_index", "is_ready")
+
 class LobbyPlayer(models.Model):
     """
     A mapping of a Player into a specific Game's lobby. This is the per-game player state
@@ -466,17 +682,103 @@ class LobbyPlayer(models.Model):
     is_ready = models.BooleanField(default=False)
     is_owner = models.BooleanField(default=False)
     joined_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = models.Manager()
+    ready_objects = LobbyPlayerReadyManager()
 
     class Meta:
         unique_together = ("game", "seat_index")
         ordering = ["seat_index"]
+        indexes = [
+            # readiness checks: filter(game=..., is_ready=False)
+            models.Index(fields=["game", "is_ready"], name="lobbyplayer_game_ready_idx"),
+        ]
 
     def __str__(self):
         return f"{self.player} in {self.game.public_id} (seat {self.seat_index})"
 
+    @classmethod
+    def bulk_initialize(cls, game, players, **defaults):
+        """
+        Seat several players in a game with one multi-row INSERT.
+        Seats are assigned after the highest occupied seat, in the given order; the game
+        row is locked meanwhile, as in join_game, so concurrent seating can't collide.
+        Note: bulk_create skips save() and post_save signals, so the game's memoized
+        seat count is dropped here instead.
+        """
+        with transaction.atomic():
+            Game.objects.select_for_update().only("pk").get(pk=game.pk)
+            max_seat = game.lobby_players.aggregate(m=models.Max("seat_index"))["m"]
+            first_seat = 0 if max_seat is None else max_seat + 1
+            seats = cls.objects.bulk_create([
+                cls(game=game, player=player, seat_index=first_seat + i, **defaults)
+                for i, player in enumerate(players)
+            ])
+        game.__dict__.pop("active_players_count", None)
+        return seats
+
+    @classmethod
+    def bulk_adjust_cash(cls, deltas) -> int:
+        """
+        Apply many cash changes (payouts, "collect from every player" cards, ...) in a single
+        UPDATE ... SET cash = CASE ... END. deltas maps LobbyPlayer pk -> amount (negative
+        to debit). No balance check is made. Returns the number of rows updated.
+        """
+        if not deltas:
+            return 0
+        whens = [When(pk=pk, then=F("cash") + Value(amount)) for pk, amount in deltas.items()]
+        return cls.objects.filter(pk__in=list(deltas)).update(
+            cash=Case(*whens, default=F("cash"), output_field=models.BigIntegerField()),
+            updated_at=Now(),
+        )
+
+    def set_ready(self, value=True) -> bool:
+        """
+        Mark this seat ready/unready. The UPDATE only matches when the flag actually
+        changes, so repeated clicks don't rewrite the row. Returns True if it changed.
+        """
+        updated = LobbyPlayer.objects.filter(pk=self.pk).exclude(is_ready=value).update(
+            is_ready=value, updated_at=Now()
+        )
+        self.is_ready = value
+        return bool(updated)
+
+    def toggle_ready(self):
+        """Flip is_ready in one UPDATE ... SET is_ready = NOT is_ready, then reload the flag."""
+        LobbyPlayer.objects.filter(pk=self.pk).update(is_ready=~F("is_ready"), updated_at=Now())
+        self.refresh_from_db(fields=["is_ready", "updated_at"])
+        return self.is_ready
+
+    def add_cash(self, amount):
+        """
+        Credit this seat with a single UPDATE ... SET cash = cash + amount.
+        No read is needed and concurrent credits/debits can't overwrite each other.
+        """
+        if not amount:
+            return
+        LobbyPlayer.objects.filter(pk=self.pk).update(cash=F("cash") + amount, updated_at=Now())
+        self.cash += amount
+
+    def remove_cash(self, amount) -> bool:
+        """
+        Debit this seat atomically. The balance check happens in the same UPDATE,
+        so returns False (and changes nothing) when funds are insufficient.
+        """
+        updated = LobbyPlayer.objects.filter(pk=self.pk, cash__gte=amount).update(cash=F("cash") - amount, updated_at=Now())
+        if updated:
+            self.cash -= amount
+        return bool(updated)
+
 # -------------------------------------
 # Per-game board tile state (ownership & development)
 # -------------------------------------
+# GameBoardTileState fields current_rent is derived from
+RENT_INPUT_FIELDS = {
+    "owner", "owner_id", "houses", "mortgaged",
+    "board_position", "board_position_id", "board_tile", "board_tile_id",
+}
+
 class GameBoardTileState(models.Model):
     """
     Per-game state for each board position: who owns it, how many houses, is mortgaged, etc.
@@ -507,11 +809,20 @@ class GameBoardTileState(models.Model):
     owner = models.ForeignKey(Player, related_name="owned_tiles", null=True, blank=True, on_delete=models.SET_NULL)
     houses = models.PositiveSmallIntegerField(default=0)  # 0..4 houses, 5 considered hotel if you like
     mortgaged = models.BooleanField(default=False)
+    # denormalized rent owed when landing here; recomputed in save() so list views and
+    # aggregates (e.g. Sum("current_rent")) read a column instead of walking City rows.
+    # Saving a City refreshes it too (refresh_rent_for_city); QuerySet.update() and
+    # bulk_update() bypass save(), so callers using them must set it themselves.
+    current_rent = models.PositiveIntegerField(default=0, db_index=True)
     last_rent_collected_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         unique_together = ("game", "position")
         ordering = ["position"]
+        indexes = [
+            # "tiles owned by player X in game Y"
+            models.Index(fields=["game", "owner"], name="tilestate_game_owner_idx"),
+        ]
 
     def __str__(self):
         # Try to get title from board_position or board_tile
@@ -525,6 +836,236 @@ class GameBoardTileState(models.Model):
             title = "Unknown"
         return f"State: {title} @ {self.position} in {self.game.public_id}"
 
+    def compute_rent(self) -> int:
+        """
+        Rent from the underlying City: 0 when unowned, mortgaged, or not a property.
+        """
+        if self.mortgaged or not self.owner_id:
+            return 0
+        city = None
+        if self.board_position_id:
+            if GameBoardTileState.board_position.is_cached(self):
+                city = self.board_position.city
+            else:
+                city = City.raw_objects.filter(board_positions=self.board_position_id).first()
+        elif self.board_tile_id:
+            city = City.raw_objects.filter(tile__instances=self.board_tile_id).first()
+        return city.rent_for(self.houses) if city else 0
+
+    def calculate_rent(self) -> int:
+        """
+        Current rent for this tile in this game (stored column, no lookups).
+        """
+        return self.current_rent
+
+    def save(self, *args, **kwargs):
+        # only look the rent up again when a field it depends on is being written
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            self.current_rent = self.compute_rent()
+        elif RENT_INPUT_FIELDS.intersection(update_fields):
+            self.current_rent = self.compute_rent()
+            kwargs["update_fields"] = {*update_fields, "current_rent"}
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def refresh_rent_for_city(cls, city) -> int:
+        """
+        Recompute current_rent for every owned, unmortgaged tile state built on this City
+        with one UPDATE per schema, e.g. after its rent table changes. Returns the number
+        of rows updated.
+        """
+        rent = Case(
+            When(houses__lte=0, then=Value(city.rent_base)),
+            *[When(houses=n, then=Value(getattr(city, f"rent_house_{n}"))) for n in range(1, 5)],
+            default=Value(city.rent_hotel),
+            output_field=models.PositiveIntegerField(),
+        )
+        owned = cls.objects.filter(owner__isnull=False, mortgaged=False)
+        return (
+            owned.filter(board_position__city=city).update(current_rent=rent)
+            + owned.filter(board_position__isnull=True, board_tile__tile_id=city.tile_id).update(current_rent=rent)
+        )
+
+    @classmethod
+    def with_bids(cls):
+        """
+        Tile states with their bids prefetched highest-first, each bid joined to its
+        bidder's display name only. Two queries however many tiles and bids are shown.
+        """
+        bids = (
+            Bid.raw_objects.select_related("player")
+            .only("id", "board_tile_state", "amount", "created_at", "player__display_name")
+            .order_by("-amount")
+        )
+        return cls.objects.prefetch_related(Prefetch("bid_set", queryset=bids))
+
+    def highest_bid(self) -> int:
+        """
+        Highest bid placed on this tile so far (0 if none). Derived from Bid rows
+        rather than stored, so recording a bid is a single INSERT.
+        """
+        return Bid.raw_objects.filter(board_tile_state=self).aggregate(m=Max("amount"))["m"] or 0
+
+    @cached_property
+    def min_next_bid(self) -> int:
+        """
+        Smallest acceptable next bid, kept on the instance so auction UIs can show it
+        without re-aggregating. place_bids_bulk() refreshes it after each batch.
+        """
+        return self.highest_bid() + 1
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop("min_next_bid", None)
+        super().refresh_from_db(*args, **kwargs)
+
+    def place_bids_bulk(self, bids):
+        """
+        Record several (player, amount) auction bids on this tile with one multi-row INSERT.
+        Bids are checked in ascending amount order: each must reach the minimum next bid
+        (re-read under the lock) and be covered by the bidder's cash in this game.
+        Raises ValidationError if the tile is already owned or on the first invalid bid,
+        in which case nothing is recorded. Returns the created Bid objects.
+        """
+        bids = sorted(bids, key=lambda b: b[1])
+        with transaction.atomic():
+            # lock the auctioned tile so concurrent bidders are checked one after another,
+            # and re-read the owner under that lock: owned tiles are no longer auctioned
+            owner_id = (
+                GameBoardTileState.objects.select_for_update()
+                .values_list("owner_id", flat=True)
+                .get(pk=self.pk)
+            )
+            if owner_id is not None:
+                raise ValidationError("This tile is already owned.")
+            floor = self.highest_bid() + 1
+            cash = dict(
+                LobbyPlayer.objects.filter(game_id=self.game_id, player__in=[p for p, _ in bids])
+                .values_list("player_id", "cash")
+            )
+            objs = []
+            for player, amount in bids:
+                if amount < floor:
+                    raise ValidationError(f"Bid of {amount} is below the minimum of {floor}.")
+                if cash.get(player.pk, 0) < amount:
+                    raise ValidationError(f"{player} cannot cover a bid of {amount}.")
+                floor = amount + 1
+                objs.append(Bid(game_id=self.game_id, player=player, board_tile_state=self, amount=amount))
+            created = Bid.raw_objects.bulk_create(objs, batch_size=1000)
+        self.min_next_bid = floor
+        return created
+
+    def place_bid(self, player, amount):
+        """Record a single auction bid on this tile. See place_bids_bulk()."""
+        return self.place_bids_bulk([(player, amount)])[0]
+
+    async def aplace_bid(self, player, amount):
+        """
+        Async place_bid() for websocket consumers. The bid needs a transaction and a row
+        lock, which Django's async ORM can't hold yet, so this runs in one thread hop.
+        """
+        return await sync_to_async(self.place_bid)(player, amount)
+
+    def settle_auction(self) -> bool:
+        """
+        Award this tile to its highest bidder. The tile is locked first (the same lock
+        place_bids_bulk() takes), so the top bid can't change while it is settled. The
+        ownership write only matches an unowned tile and the debit only matches a seat
+        that can still pay, both as conditional UPDATEs in one transaction; if either
+        misses, nothing changes. Returns True if the tile changed hands.
+        """
+        with transaction.atomic():
+            GameBoardTileState.objects.select_for_update().only("pk").get(pk=self.pk)
+            top = (
+                Bid.raw_objects.filter(board_tile_state=self)
+                .order_by("-amount")
+                .values_list("player", "amount")
+                .first()
+            )
+            if top is None:
+                return False
+            player_id, amount = top
+            previous_owner_id, self.owner_id = self.owner_id, player_id
+            rent = self.compute_rent()
+            claimed = GameBoardTileState.objects.filter(pk=self.pk, owner__isnull=True).update(
+                owner_id=player_id, current_rent=rent
+            )
+            paid = claimed and LobbyPlayer.objects.filter(
+                game_id=self.game_id, player_id=player_id, cash__gte=amount
+            ).update(cash=F("cash") - amount, updated_at=Now())
+            if not paid:
+                transaction.set_rollback(True)
+                self.owner_id = previous_owner_id
+                return False
+        self.current_rent = rent
+        return True
+
+    @classmethod
+    def settle_auctions(cls, tile_states):
+        """
+        Award each unowned tile in tile_states to its highest bidder and charge the bid.
+        All tiles are written with one bulk_update and all cash debits with one UPDATE,
+        however many auctions close together. The tiles and the winners' seats are locked
+        first; tiles claimed in the meantime are skipped, as are winners whose seat can no
+        longer cover the bid (like settle_auction()). Tiles without bids stay unowned.
+        Returns the tile states that changed hands.
+        """
+        with transaction.atomic():
+            unowned = set(
+                cls.objects.select_for_update()
+                .filter(pk__in=[s.pk for s in tile_states if not s.owner_id], owner__isnull=True)
+                .values_list("pk", flat=True)
+            )
+            states = {s.pk: s for s in tile_states if s.pk in unowned}
+            if not states:
+                return []
+            winners = {}
+            for state_id, player_id, amount in (
+                Bid.raw_objects.filter(board_tile_state__in=list(states))
+                .order_by("board_tile_state", "-amount")
+                .values_list("board_tile_state", "player", "amount")
+            ):
+                winners.setdefault(state_id, (player_id, amount))
+            seats = {
+                (game_id, player_id): [pk, cash]
+                for game_id, player_id, pk, cash in LobbyPlayer.objects.select_for_update().filter(
+                    game_id__in={states[s].game_id for s in winners},
+                    player_id__in={p for p, _ in winners.values()},
+                ).values_list("game_id", "player_id", "pk", "cash")
+            }
+
+            won, deltas = [], {}
+            for state_id, (player_id, amount) in winners.items():
+                state = states[state_id]
+                seat = seats.get((state.game_id, player_id))
+                # the balance left after this seat's earlier wins in the same batch
+                if seat is None or seat[1] < amount:
+                    continue
+                seat[1] -= amount
+                state.owner_id = player_id
+                won.append(state)
+                deltas[seat[0]] = deltas.get(seat[0], 0) - amount
+
+            # the won tiles' cities in one query per schema instead of one per tile
+            positions = BoardPosition.objects.select_related("city").in_bulk(
+                {s.board_position_id for s in won if s.board_position_id}
+            )
+            board_tiles = BoardTile.objects.select_related("tile__city").in_bulk(
+                {s.board_tile_id for s in won if not s.board_position_id and s.board_tile_id}
+            )
+            for state in won:
+                if state.board_position_id:
+                    city = positions[state.board_position_id].city
+                elif state.board_tile_id:
+                    city = getattr(board_tiles[state.board_tile_id].tile, "city", None)
+                else:
+                    city = None
+                state.current_rent = city.rent_for(state.houses) if city and not state.mortgaged else 0
+
+            cls.objects.bulk_update(won, ["owner", "current_rent"], batch_size=1000)
+            LobbyPlayer.bulk_adjust_cash(deltas)
+        return won
+
 # -------------------------------------
 # Turn, Action, Trade, Bid, Chat
 # -------------------------------------
@@ -535,11 +1076,36 @@ class Turn(models.Model):
     game = models.ForeignKey(Game, related_name="turns", on_delete=models.CASCADE)
     current_player = models.ForeignKey(Player, null=True, on_delete=models.SET_NULL)
     round_number = models.PositiveIntegerField(default=1)
+    # last dice roll of this turn as typed columns (no JSON parse on read)
+    die1 = models.PositiveSmallIntegerField(null=True, blank=True)
+    die2 = models.PositiveSmallIntegerField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # latest turn of a game
+            models.Index(fields=["game", "-round_number", "-created_at"], name="turn_game_latest_idx"),
+        ]
+
     def __str__(self):
         return f"{self.game.public_id} Round {self.round_number} - {self.current_player}"
 
+    @property
+    def dice_total(self):
+        if self.die1 is None or self.die2 is None:
+            return None
+        return self.die1 + self.die2
+
+    @classmethod
+    def for_game_stream(cls, game, chunk_size=2000):
+        """Iterate over a game's turns in order without caching the whole result set."""
+        return (
+            cls.objects.filter(game=game)
+            .select_related("current_player")
+            .order_by("round_number", "created_at")
+            .iterator(chunk_size=chunk_size)
+        )
+
 class ActionLog(models.Model):
     """
     Record of actions taken by players. Used for auditing, replay, and deterministic replay in multiplayer.
@@ -552,6 +1118,26 @@ class ActionLog(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # filter by kind of action within a game without scanning payloads
+            models.Index(fields=["game", "action_type"], name="actionlog_game_type_idx"),
+            # a game's history in order; keeps each game's rows clustered in the index
+            models.Index(fields=["game", "created_at"], name="actionlog_game_created_idx"),
+        ]
+
+    @classmethod
+    def for_game_stream(cls, game, chunk_size=2000):
+        """
+        Iterate over a game's action history for exports/replay. Rows are fetched
+        chunk_size at a time (a server-side cursor on Postgres) instead of being held
+        in the queryset cache, so memory stays bounded however long the log is.
+        """
+        return (
+            cls.objects.filter(game=game)
+            .select_related("player")
+            .order_by("created_at")
+            .iterator(chunk_size=chunk_size)
+        )
 
 class Trade(models.Model):
     """
@@ -565,6 +1151,24 @@ class Trade(models.Model):
     accepted = models.BooleanField(null=True, default=None)  # None = pending, True = accepted, False = rejected
     created_at = models.DateTimeField(auto_now_add=True)
 
+    def resolve(self, accepted: bool) -> bool:
+        """
+        Accept or reject a pending offer with one conditional UPDATE. The pending check
+        is part of the WHERE clause, so a trade can't be resolved twice by racing
+        requests. Returns False if it was already resolved.
+        """
+        updated = Trade.objects.filter(pk=self.pk, accepted__isnull=True).update(accepted=accepted)
+        if updated:
+            self.accepted = accepted
+        return bool(updated)
+
+class BidManager(models.Manager):
+    """
+    Joins game and player by default since __str__ reads both.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related("game", "player")
+
 class Bid(models.Model):
     """
     Auction bids for a tile. Each bid references the GameBoardTileState (or board_tile) being auctioned.
@@ -575,6 +1179,35 @@ class Bid(models.Model):
     amount = models.BigIntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = BidManager()
+    raw_objects = models.Manager()  # no joins; for bulk writes and updates
+
+    class Meta:
+        indexes = [
+            # highest bid on a tile: MAX(amount) is read from the end of the index
+            models.Index(fields=["board_tile_state", "-amount"], name="bid_tilestate_amount_idx"),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(amount__gt=0), name="bid_amount_positive"),
+        ]
+
+    def __str__(self):
+        return f"{self.player} bids {self.amount} in {self.game.public_id}"
+
+class ChatMessageManager(models.Manager):
+    """
+    Joins game and player by default - chat logs render both for every message.
+    """
+    def get_queryset(self):
+        return super().get_queryset().select_related("game", "player")
+
+    def headers(self):
+        """
+        Messages without their text column, for counts, activity timestamps and
+        moderation lists that never render the body.
+        """
+        return super().get_queryset().defer("message")
+
 class ChatMessage(models.Model):
     """
     In-game chat.
@@ -585,8 +1218,25 @@ class ChatMessage(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     is_system = models.BooleanField(default=False)
 
+    objects = ChatMessageManager()
+    raw_objects = models.Manager()  # no joins; for bulk writes and updates
+
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # one composite index serves a game's chat log in order; no per-column indexes
+            # to maintain on every message INSERT
+            models.Index(fields=["game", "created_at"], name="chatmessage_game_created_idx"),
+        ]
+
+    def __str__(self):
+        sender = "System" if self.is_system or not self.player_id else self.player
+        return f"[{self.game.public_id}] {sender}: {self.message[:40]}"
+
+    @classmethod
+    async def acreate_system(cls, game, message):
+        """Post a system message from async code (a single INSERT via the native async ORM)."""
+        return await cls.raw_objects.acreate(game=game, message=message, is_system=True)
 
 
 # -------------------------------------
@@ -601,3 +1251,48 @@ def auto_initialize_board_positions(sender, instance, created, **kwargs):
     if created:
         # Run initialization in a separate transaction to avoid conflicts
         transaction.on_commit(lambda: instance.initialize_positions())
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def invalidate_lobby_boards(sender, instance, **kwargs):
+    """
+    Drop the cached lobby board list whenever a board is added, renamed or removed.
+    """
+    cache.delete(LOBBY_BOARDS_CACHE_KEY)
+
+
+@receiver(post_save, sender=User)
+def ensure_player(sender, instance, created, **kwargs):
+    """
+    Give every new account its Player up front, so creating or joining a game only has
+    to look it up instead of get_or_create-ing it on the request path.
+    """
+    if created:
+        Player.objects.create(user=instance, display_name=instance.get_username())
+
+@receiver(post_save, sender=City)
+def refresh_city_rents(sender, instance, **kwargs):
+    """
+    Keep the stored current_rent of tiles on this City in step with its rent table.
+    """
+    GameBoardTileState.refresh_rent_for_city(instance)
+
+@receiver(post_save, sender=LobbyPlayer)
+@receiver(post_delete, sender=LobbyPlayer)
+def invalidate_active_players_count(sender, instance, **kwargs):
+    """
+    Forget the memoized seat count on the Game instance this seat was saved through.
+    """
+    if LobbyPlayer.game.is_cached(instance):
+        instance.game.__dict__.pop("active_players_count", None)
+
+
+@receiver(post_save, sender=Tile)
+@receiver(post_delete, sender=Tile)
+def invalidate_canonical_tile_cache(sender, instance, **kwargs):
+    """
+    Drop the cached canonical tiles whenever one of the special tile types changes.
+    """
+    if instance.tile_type in CANONICAL_TILE_TYPES:
+        _canonical_cache.clear()
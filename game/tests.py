@@ -1,6 +1,8 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch
 from .models import (
     Board, Tile, BoardTile, BoardPosition, City, Game, Player, LobbyPlayer,
     GameBoardTileState, Turn, ActionLog, Trade, Bid, ChatMessage,
@@ -8,9 +10,11 @@ from .models import (
 )
 
 
-class BoardModelTest(TestCase):
+class BoardModelTest(SimpleTestCase):
+    """Pure attribute/method checks on an unsaved Board (no database access)"""
+
     def setUp(self):
-        self.board = Board.objects.create(
+        self.board = Board(
             name="Test Board",
             size=10,
             theme="classic",
@@ -40,9 +44,11 @@ class BoardModelTest(TestCase):
         self.assertEqual(positions["go_to_prison"], 29)  # 3n-1
 
 
-class TileModelTest(TestCase):
+class TileModelTest(SimpleTestCase):
+    """Pure attribute/method checks on an unsaved Tile (no database access)"""
+
     def setUp(self):
-        self.tile = Tile.objects.create(
+        self.tile = Tile(
             title="Mediterranean Avenue",
             tile_type=TileType.CUSTOM,  # Changed from CITY
             description="A property tile",
@@ -60,14 +66,20 @@ class TileModelTest(TestCase):
         """Test tile string representation"""
         self.assertEqual(str(self.tile), "Mediterranean Avenue [CUSTOM]")  # Changed from CITY
 
+    def test_tile_type_display(self):
+        """Test tile type display label"""
+        self.assertEqual(self.tile.get_tile_type_display(), "Custom")
+        self.assertEqual(Tile(tile_type=TileType.GO_TO_JAIL).get_tile_type_display(), "GoToJail")
+
 
 class BoardTileModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.tile = Tile.objects.create(title="GO", tile_type=TileType.START)
-        self.board_tile = BoardTile.objects.create(
-            board=self.board,
-            tile=self.tile,
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(name="Test Board", size=10)
+        cls.tile = Tile.objects.create(title="GO", tile_type=TileType.START)
+        cls.board_tile = BoardTile.objects.create(
+            board=cls.board,
+            tile=cls.tile,
             position=0
         )
 
@@ -77,13 +89,15 @@ class BoardTileModelTest(TestCase):
         self.assertEqual(self.board_tile.board, self.board)
         self.assertEqual(self.board_tile.tile, self.tile)
 
-    def test_board_tile_str(self):
-        """Test BoardTile string representation"""
-        self.assertEqual(str(self.board_tile), "Test Board @ 0 -> GO")
+    def test_str_needs_no_extra_queries(self):
+        """Test the default manager joins board and tile for __str__"""
+        board_tile = BoardTile.objects.get(pk=self.board_tile.pk)
+        with self.assertNumQueries(0):
+            str(board_tile)
 
     def test_unique_position_constraint(self):
         """Test that same position cannot be used twice on same board"""
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             BoardTile.objects.create(
                 board=self.board,
                 tile=self.tile,
@@ -92,13 +106,14 @@ class BoardTileModelTest(TestCase):
 
 
 class CityModelTest(TestCase):
-    def setUp(self):
-        self.tile = Tile.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.tile = Tile.objects.create(
             title="Boardwalk",
             tile_type=TileType.CUSTOM  # Changed from CITY
         )
-        self.city = City.objects.create(
-            tile=self.tile,
+        cls.city = City.objects.create(
+            tile=cls.tile,
             country="USA",
             base_price=400,
             mortgage_value=200,
@@ -119,39 +134,44 @@ class CityModelTest(TestCase):
         self.assertEqual(self.city.color_group, "Dark Blue")
         self.assertEqual(self.city.rent_hotel, 2000)
 
-    def test_city_str(self):
-        """Test City string representation"""
-        self.assertEqual(str(self.city), "City: Boardwalk (400)")
-
     def test_onetoone_with_tile(self):
         """Test that only one City can be attached to a Tile"""
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             City.objects.create(tile=self.tile, base_price=100)
 
 
-class GameModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(
-            board=self.board,
-            owner=self.user,
-            name="Test Game",
-            max_players=4
-        )
+class GameFixtureMixin:
+    """Board, owner, game and one player, created once per test class."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(name="Test Board", size=10)
+        cls.user = User.objects.create_user(username="testuser")
+        cls.game = Game.objects.create(board=cls.board, owner=cls.user, name="Test Game")
+        # the Player made along with the account
+        cls.player = Player.for_user(cls.user)
+
+
+def create_property_tile(board, position, title="Property"):
+    """Create a CUSTOM tile and place it on the board at position; returns (tile, board_tile)."""
+    tile = Tile.objects.create(title=title, tile_type=TileType.CUSTOM)
+    return tile, BoardTile.objects.create(board=board, tile=tile, position=position)
+
 
+class GameModelTest(GameFixtureMixin, TestCase):
     def test_game_creation(self):
         """Test Game is created with correct defaults"""
         self.assertEqual(self.game.name, "Test Game")
         self.assertEqual(self.game.status, GameStatus.LOBBY)
-        self.assertEqual(self.game.max_players, 4)
+        self.assertEqual(self.game.max_players, 6)
         self.assertIsNotNone(self.game.uuid)
         self.assertIsNotNone(self.game.public_id)
 
-    def test_game_str(self):
-        """Test Game string representation"""
-        self.assertIn(self.game.public_id, str(self.game))
-        self.assertIn("LOBBY", str(self.game))
+    def test_in_progress(self):
+        """Test in-progress status set on the instance and the queryset"""
+        self.assertFalse(self.game.is_in_progress)
+        Game.objects.filter(pk=self.game.pk).update(status=GameStatus.PAUSED)
+        self.assertEqual(list(Game.objects.in_progress()), [self.game])
 
     def test_all_players_ready_empty(self):
         """Test all_players_ready returns False when no players"""
@@ -159,33 +179,67 @@ class GameModelTest(TestCase):
 
     def test_can_start_requires_owner(self):
         """Test that only owner can start game"""
-        other_user = User.objects.create_user(username="other", password="pass123")
+        other_user = User.objects.create_user(username="other")
         self.assertFalse(self.game.can_start(other_user))
         self.assertFalse(self.game.can_start(self.user))  # Not enough players
 
 
-class PlayerModelTest(TestCase):
+class GameInstanceTest(SimpleTestCase):
+    """Pure attribute/method checks on an unsaved Game (no database access)"""
+
     def setUp(self):
-        self.user = User.objects.create_user(username="player1", password="pass123")
-        self.player = Player.objects.create(
-            user=self.user,
-            display_name="Player One",
-            is_ai=False
-        )
+        self.game = Game(name="Test Game")
+
+    def test_game_str(self):
+        """Test Game string representation"""
+        self.assertEqual(str(self.game), f"Game {self.game.public_id} (LOBBY)")
+
+    def test_display_labels(self):
+        """Test status/mode display labels"""
+        self.assertEqual(self.game.get_status_display(), "Lobby")
+        self.assertEqual(self.game.get_mode_display(), "Online")
+
+
+class PlayerModelTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="player1")
+        cls.player = Player.for_user(cls.user)
 
     def test_player_creation(self):
         """Test Player is created correctly"""
-        self.assertEqual(self.player.display_name, "Player One")
+        self.assertEqual(self.player.display_name, "player1")
         self.assertFalse(self.player.is_ai)
         self.assertEqual(self.player.user, self.user)
 
+    def test_new_user_gets_player(self):
+        """Test a Player is created along with each new account"""
+        user = User.objects.create_user(username="newcomer")
+        player = Player.objects.get(user=user)
+        self.assertEqual(player.display_name, "newcomer")
+        # looked up, not created, from then on
+        with self.assertNumQueries(1):
+            self.assertEqual(Player.for_user(user), player)
+
+    def test_for_user_creates_missing_player(self):
+        """Test for_user creates the Player for accounts made without signals"""
+        # bulk_create skips post_save, so this user has no Player yet
+        user, = User.objects.bulk_create([User(username="imported")])
+        player = Player.for_user(user)
+        self.assertEqual(player.display_name, "imported")
+        self.assertEqual(Player.objects.filter(user=user).get(), player)
+
+
+class PlayerInstanceTest(SimpleTestCase):
+    """Pure attribute/method checks on an unsaved Player (no database access)"""
+
     def test_player_str(self):
         """Test Player string representation"""
-        self.assertEqual(str(self.player), "Player One")
+        self.assertEqual(str(Player(display_name="Player One")), "Player One")
 
     def test_ai_player(self):
-        """Test creating an AI player without user"""
-        ai_player = Player.objects.create(
+        """Test an AI player has no user"""
+        ai_player = Player(
             display_name="AI Bot",
             is_ai=True
         )
@@ -193,15 +247,48 @@ class PlayerModelTest(TestCase):
         self.assertTrue(ai_player.is_ai)
 
 
-class LobbyPlayerModelTest(TestCase):
+class StrReprTest(SimpleTestCase):
+    """__str__ of the related-object models, built from unsaved instances (no database access)"""
+
     def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user, name="Test Game")
-        self.player = Player.objects.create(user=self.user, display_name="Test Player")
-        self.lobby_player = LobbyPlayer.objects.create(
-            game=self.game,
-            player=self.player,
+        self.board = Board(name="Test Board", size=10)
+        self.game = Game(board=self.board, public_id="abc123")
+        self.player = Player(display_name="Test Player")
+
+    def test_board_tile_str(self):
+        """Test BoardTile string representation"""
+        board_tile = BoardTile(board=self.board, tile=Tile(title="GO"), position=0)
+        self.assertEqual(str(board_tile), "Test Board @ 0 -> GO")
+
+    def test_city_str(self):
+        """Test City string representation"""
+        city = City(tile=Tile(title="Boardwalk"), base_price=400)
+        self.assertEqual(str(city), "City: Boardwalk (400)")
+
+    def test_lobby_player_str(self):
+        """Test LobbyPlayer string representation"""
+        seat = LobbyPlayer(game=self.game, player=self.player, seat_index=0)
+        self.assertEqual(str(seat), "Test Player in abc123 (seat 0)")
+
+    def test_tile_state_str(self):
+        """Test GameBoardTileState string representation"""
+        board_tile = BoardTile(board=self.board, tile=Tile(title="Property"), position=5)
+        tile_state = GameBoardTileState(game=self.game, board_tile=board_tile, position=5)
+        self.assertEqual(str(tile_state), "State: Property @ 5 in abc123")
+
+    def test_turn_str(self):
+        """Test Turn string representation"""
+        turn = Turn(game=self.game, current_player=self.player, round_number=1)
+        self.assertEqual(str(turn), "abc123 Round 1 - Test Player")
+
+
+class LobbyPlayerModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.lobby_player = LobbyPlayer.objects.create(
+            game=cls.game,
+            player=cls.player,
             seat_index=0,
             cash=1500,
             is_ready=False,
@@ -215,15 +302,61 @@ class LobbyPlayerModelTest(TestCase):
         self.assertFalse(self.lobby_player.is_ready)
         self.assertTrue(self.lobby_player.is_owner)
 
-    def test_lobby_player_str(self):
-        """Test LobbyPlayer string representation"""
-        self.assertIn("Test Player", str(self.lobby_player))
-        self.assertIn(self.game.public_id, str(self.lobby_player))
+    def test_bulk_initialize(self):
+        """Test bulk_initialize seats players after the last occupied seat"""
+        players = Player.objects.bulk_create([Player(display_name=f"Bulk {i}") for i in range(3)])
+        # memoize the count first; seating must not leave it stale
+        self.assertEqual(self.game.get_active_players_count(), 1)
+        seats = LobbyPlayer.bulk_initialize(self.game, players)
+        self.assertEqual([lp.seat_index for lp in seats], [1, 2, 3])
+        self.assertEqual(self.game.get_active_players_count(), 4)
+
+    def test_bulk_adjust_cash(self):
+        """Test bulk_adjust_cash applies per-seat deltas in one UPDATE"""
+        other = LobbyPlayer.objects.create(
+            game=self.game, player=Player.objects.create(display_name="Other"), seat_index=1
+        )
+        with self.assertNumQueries(1):
+            updated = LobbyPlayer.bulk_adjust_cash({self.lobby_player.pk: -50, other.pk: 50})
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            dict(self.game.lobby_players.values_list("seat_index", "cash")),
+            {0: 1450, 1: 1550},
+        )
+
+    def test_add_cash(self):
+        """Test add_cash credits the seat in one UPDATE"""
+        with self.assertNumQueries(1):
+            self.lobby_player.add_cash(200)
+        self.assertEqual(self.lobby_player.cash, 1700)
+        self.lobby_player.refresh_from_db()
+        self.assertEqual(self.lobby_player.cash, 1700)
+
+    def test_remove_cash_insufficient_funds(self):
+        """Test remove_cash refuses to overdraw"""
+        self.assertTrue(self.lobby_player.remove_cash(500))
+        self.assertFalse(self.lobby_player.remove_cash(5000))
+        self.lobby_player.refresh_from_db()
+        self.assertEqual(self.lobby_player.cash, 1000)
+
+    def test_set_ready_skips_noop(self):
+        """Test set_ready only writes when the flag changes"""
+        self.assertTrue(self.lobby_player.set_ready(True))
+        self.assertFalse(self.lobby_player.set_ready(True))
+        self.lobby_player.refresh_from_db()
+        self.assertTrue(self.lobby_player.is_ready)
+
+    def test_toggle_ready(self):
+        """Test toggle_ready flips the flag in the database"""
+        self.assertTrue(self.lobby_player.toggle_ready())
+        self.assertFalse(self.lobby_player.toggle_ready())
+        self.lobby_player.refresh_from_db()
+        self.assertFalse(self.lobby_player.is_ready)
 
     def test_unique_seat_constraint(self):
         """Test that same seat cannot be used twice in same game"""
         player2 = Player.objects.create(display_name="Player 2")
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             LobbyPlayer.objects.create(
                 game=self.game,
                 player=player2,
@@ -231,23 +364,16 @@ class LobbyPlayerModelTest(TestCase):
             )
 
 
-class GameBoardTileStateModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.tile = Tile.objects.create(title="Property", tile_type=TileType.CUSTOM)  # Changed from CITY
-        self.board_tile = BoardTile.objects.create(
-            board=self.board,
-            tile=self.tile,
-            position=5
-        )
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player = Player.objects.create(display_name="Test Player")
-        self.tile_state = GameBoardTileState.objects.create(
-            game=self.game,
-            board_tile=self.board_tile,
+class GameBoardTileStateModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.tile, cls.board_tile = create_property_tile(cls.board, position=5)
+        cls.tile_state = GameBoardTileState.objects.create(
+            game=cls.game,
+            board_tile=cls.board_tile,
             position=5,
-            owner=self.player,
+            owner=cls.player,
             houses=2,
             mortgaged=False
         )
@@ -258,21 +384,71 @@ class GameBoardTileStateModelTest(TestCase):
         self.assertEqual(self.tile_state.owner, self.player)
         self.assertFalse(self.tile_state.mortgaged)
 
-    def test_tile_state_str(self):
-        """Test GameBoardTileState string representation"""
-        self.assertIn("Property", str(self.tile_state))
-        self.assertIn(str(5), str(self.tile_state))
-
-
-class TurnModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player = Player.objects.create(display_name="Test Player")
-        self.turn = Turn.objects.create(
-            game=self.game,
-            current_player=self.player,
+    def test_current_rent_follows_city_rent(self):
+        """Test current_rent is recomputed from the City on save"""
+        City.objects.create(tile=self.tile, rent_base=10, rent_house_2=150)
+        self.tile_state.save()
+        self.assertEqual(self.tile_state.calculate_rent(), 150)
+        self.tile_state.mortgaged = True
+        self.tile_state.save(update_fields=["mortgaged"])
+        self.tile_state.refresh_from_db()
+        self.assertEqual(self.tile_state.current_rent, 0)
+
+    def test_compute_rent_in_memory(self):
+        """Test compute_rent follows unsaved owner/houses/mortgage changes"""
+        City.objects.create(tile=self.tile, rent_base=10, rent_house_1=50, rent_hotel=750)
+        cases = [
+            ({"houses": 0}, 10),
+            ({"houses": 1}, 50),
+            ({"houses": 5}, 750),
+            ({"houses": 1, "mortgaged": True}, 0),
+            ({"houses": 1, "owner": None}, 0),
+        ]
+        for changes, rent in cases:
+            with self.subTest(changes=changes):
+                state = GameBoardTileState(
+                    game=self.game, board_tile=self.board_tile, position=5, owner=self.player
+                )
+                for field, value in changes.items():
+                    setattr(state, field, value)
+                self.assertEqual(state.compute_rent(), rent)
+
+    def test_save_skips_rent_lookup_for_unrelated_fields(self):
+        """Test saves that don't touch rent inputs neither look up nor write current_rent"""
+        City.objects.create(tile=self.tile, rent_house_2=150)
+        with self.assertNumQueries(0):
+            self.tile_state.save(update_fields=[])
+        self.tile_state.position = 7
+        with self.assertNumQueries(1):
+            self.tile_state.save(update_fields=["position"])
+        # the City lookup is a single query, without the default tile join
+        self.tile_state.houses = 2
+        with self.assertNumQueries(2):
+            self.tile_state.save(update_fields=["houses"])
+        self.assertEqual(self.tile_state.current_rent, 150)
+
+    def test_city_save_refreshes_current_rent(self):
+        """Test editing a City's rent table updates the stored rent of its owned tiles"""
+        city = City.objects.create(tile=self.tile, rent_house_2=150)
+        self.tile_state.refresh_from_db()
+        self.assertEqual(self.tile_state.current_rent, 150)
+        city.rent_house_2 = 200
+        city.save()
+        self.tile_state.refresh_from_db()
+        self.assertEqual(self.tile_state.current_rent, 200)
+
+    def test_current_rent_zero_without_city(self):
+        """Test non-property tiles never charge rent"""
+        self.assertEqual(self.tile_state.calculate_rent(), 0)
+
+
+class TurnModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.turn = Turn.objects.create(
+            game=cls.game,
+            current_player=cls.player,
             round_number=1
         )
 
@@ -281,21 +457,20 @@ class TurnModelTest(TestCase):
         self.assertEqual(self.turn.round_number, 1)
         self.assertEqual(self.turn.current_player, self.player)
 
-    def test_turn_str(self):
-        """Test Turn string representation"""
-        self.assertIn(self.game.public_id, str(self.turn))
-        self.assertIn("Round 1", str(self.turn))
+    def test_dice_total(self):
+        """Test dice_total sums the typed dice columns"""
+        self.assertIsNone(self.turn.dice_total)
+        self.turn.die1, self.turn.die2 = 3, 5
+        self.assertEqual(self.turn.dice_total, 8)
 
 
-class ActionLogModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player = Player.objects.create(display_name="Test Player")
-        self.action = ActionLog.objects.create(
-            game=self.game,
-            player=self.player,
+class ActionLogModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.action = ActionLog.objects.create(
+            game=cls.game,
+            player=cls.player,
             action_type="roll_dice",
             payload={"dice1": 3, "dice2": 5}
         )
@@ -305,18 +480,23 @@ class ActionLogModelTest(TestCase):
         self.assertEqual(self.action.action_type, "roll_dice")
         self.assertEqual(self.action.payload["dice1"], 3)
 
-
-class TradeModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player1 = Player.objects.create(display_name="Player 1")
-        self.player2 = Player.objects.create(display_name="Player 2")
-        self.trade = Trade.objects.create(
-            game=self.game,
-            offered_by=self.player1,
-            offered_to=self.player2,
+    def test_for_game_stream(self):
+        """Test for_game_stream yields the game's actions in order"""
+        ActionLog.objects.create(game=self.game, player=self.player, action_type="buy")
+        actions = list(ActionLog.for_game_stream(self.game, chunk_size=1))
+        self.assertEqual([a.action_type for a in actions], ["roll_dice", "buy"])
+
+
+class TradeModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.player1 = cls.player
+        cls.player2 = Player.objects.create(display_name="Player 2")
+        cls.trade = Trade.objects.create(
+            game=cls.game,
+            offered_by=cls.player1,
+            offered_to=cls.player2,
             offered={"cash": 100, "tiles": [1, 2]},
             requested={"cash": 200, "tiles": [5]},
             accepted=None
@@ -331,31 +511,31 @@ class TradeModelTest(TestCase):
     def test_trade_acceptance(self):
         """Test updating trade acceptance"""
         self.trade.accepted = True
-        self.trade.save()
+        self.trade.save(update_fields=["accepted"])
         self.assertTrue(self.trade.accepted)
 
-
-class BidModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.tile = Tile.objects.create(title="Property", tile_type=TileType.CUSTOM)  # Changed from CITY
-        self.board_tile = BoardTile.objects.create(
-            board=self.board,
-            tile=self.tile,
+    def test_resolve_only_once(self):
+        """Test resolve applies to pending trades only"""
+        self.assertTrue(self.trade.resolve(False))
+        self.assertFalse(self.trade.resolve(True))
+        self.trade.refresh_from_db()
+        self.assertFalse(self.trade.accepted)
+
+
+class BidModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.tile, cls.board_tile = create_property_tile(cls.board, position=5)
+        cls.tile_state = GameBoardTileState.objects.create(
+            game=cls.game,
+            board_tile=cls.board_tile,
             position=5
         )
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player = Player.objects.create(display_name="Test Player")
-        self.tile_state = GameBoardTileState.objects.create(
-            game=self.game,
-            board_tile=self.board_tile,
-            position=5
-        )
-        self.bid = Bid.objects.create(
-            game=self.game,
-            player=self.player,
-            board_tile_state=self.tile_state,
+        cls.bid = Bid.objects.create(
+            game=cls.game,
+            player=cls.player,
+            board_tile_state=cls.tile_state,
             amount=150
         )
 
@@ -364,16 +544,112 @@ class BidModelTest(TestCase):
         self.assertEqual(self.bid.amount, 150)
         self.assertEqual(self.bid.player, self.player)
 
+    def test_amount_must_be_positive(self):
+        """Test the database rejects non-positive bids"""
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Bid.objects.create(game=self.game, player=self.player, amount=0)
 
-class ChatMessageModelTest(TestCase):
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player = Player.objects.create(display_name="Test Player")
-        self.message = ChatMessage.objects.create(
-            game=self.game,
-            player=self.player,
+    def test_place_bids_bulk(self):
+        """Test several bids are validated and inserted together"""
+        player2 = Player.objects.create(display_name="Player 2")
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=self.game, player=self.player, seat_index=0),
+            LobbyPlayer(game=self.game, player=player2, seat_index=1),
+        ])
+        bids = self.tile_state.place_bids_bulk([(player2, 300), (self.player, 200)])
+        self.assertEqual([b.amount for b in bids], [200, 300])
+        self.assertEqual(Bid.objects.filter(board_tile_state=self.tile_state).count(), 3)
+        self.assertEqual(self.tile_state.highest_bid(), 300)
+        self.assertEqual(self.tile_state.min_next_bid, 301)
+
+    def test_with_bids(self):
+        """Test with_bids prefetches bids and bidder names in two queries"""
+        with self.assertNumQueries(2):
+            state = GameBoardTileState.with_bids().get(pk=self.tile_state.pk)
+            names = [bid.player.display_name for bid in state.bid_set.all()]
+        self.assertEqual(names, ["testuser"])
+
+    def test_place_bid_rejects_low_or_unaffordable(self):
+        """Test place_bid enforces the highest bid and the bidder's cash"""
+        LobbyPlayer.objects.create(game=self.game, player=self.player, seat_index=0, cash=500)
+        with self.assertRaises(ValidationError):
+            self.tile_state.place_bid(self.player, 100)
+        with self.assertRaises(ValidationError):
+            self.tile_state.place_bid(self.player, 600)
+        self.assertEqual(self.tile_state.place_bid(self.player, 400).amount, 400)
+
+    def test_place_bid_rejects_owned_tile(self):
+        """Test no bids are recorded on a tile that was bought since it was loaded"""
+        LobbyPlayer.objects.create(game=self.game, player=self.player, seat_index=0)
+        GameBoardTileState.objects.filter(pk=self.tile_state.pk).update(owner=self.player)
+        with self.assertRaises(ValidationError):
+            self.tile_state.place_bid(self.player, 400)
+        self.assertEqual(Bid.objects.filter(board_tile_state=self.tile_state).count(), 1)
+
+    async def test_aplace_bid(self):
+        """Test placing a bid from async code"""
+        await LobbyPlayer.objects.acreate(game=self.game, player=self.player, seat_index=0)
+        bid = await self.tile_state.aplace_bid(self.player, 200)
+        self.assertEqual(bid.amount, 200)
+
+    def test_settle_auction(self):
+        """Test a single auction is settled only when the winner can still pay"""
+        seat = LobbyPlayer.objects.create(game=self.game, player=self.player, seat_index=0, cash=100)
+        self.assertFalse(self.tile_state.settle_auction())
+        # settle_auction() keeps the instance in step with the row, no re-read needed
+        self.assertIsNone(self.tile_state.owner_id)
+        LobbyPlayer.objects.filter(pk=seat.pk).update(cash=1000)
+        self.assertTrue(self.tile_state.settle_auction())
+        seat.refresh_from_db()
+        self.assertEqual(seat.cash, 850)
+        self.assertFalse(self.tile_state.settle_auction())
+
+    def test_settle_auctions(self):
+        """Test highest bidders get their tiles and pay for them"""
+        seat = LobbyPlayer.objects.create(game=self.game, player=self.player, seat_index=0)
+        City.objects.create(tile=self.tile, rent_base=25)
+        other = GameBoardTileState.objects.create(game=self.game, board_tile=self.board_tile, position=6)
+        # savepoint, locked tiles, bids, locked seats, the won tiles' cities, tile UPDATE,
+        # cash UPDATE, release
+        with self.assertNumQueries(8):
+            won = GameBoardTileState.settle_auctions([self.tile_state, other])
+        self.assertEqual(won, [self.tile_state])
+        # the passed-in states are updated in place; only the seat needs a re-read
+        seat.refresh_from_db()
+        self.assertEqual(self.tile_state.owner_id, self.player.pk)
+        self.assertIsNone(other.owner_id)
+        self.assertTrue(
+            GameBoardTileState.objects.filter(pk=self.tile_state.pk, owner=self.player, current_rent=25).exists()
+        )
+        self.assertEqual(seat.cash, 1350)
+
+    def test_settle_auctions_skips_overdrawn_seat(self):
+        """Test a winner who can no longer cover the bid gets nothing and keeps their cash"""
+        seat = LobbyPlayer.objects.create(game=self.game, player=self.player, seat_index=0)
+        Bid.objects.create(game=self.game, player=self.player, board_tile_state=self.tile_state, amount=99_999)
+        self.assertEqual(GameBoardTileState.settle_auctions([self.tile_state]), [])
+        self.assertIsNone(self.tile_state.owner_id)
+        seat.refresh_from_db()
+        self.assertEqual(seat.cash, 1500)
+
+    def test_settle_auctions_skips_tile_claimed_since_loading(self):
+        """Test a tile owned by someone else after it was loaded is neither overwritten nor charged"""
+        seat = LobbyPlayer.objects.create(game=self.game, player=self.player, seat_index=0)
+        rival = Player.objects.create(display_name="Rival")
+        GameBoardTileState.objects.filter(pk=self.tile_state.pk).update(owner=rival)
+        self.assertEqual(GameBoardTileState.settle_auctions([self.tile_state]), [])
+        self.assertTrue(GameBoardTileState.objects.filter(pk=self.tile_state.pk, owner=rival).exists())
+        seat.refresh_from_db()
+        self.assertEqual(seat.cash, 1500)
+
+
+class ChatMessageModelTest(GameFixtureMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.message = ChatMessage.objects.create(
+            game=cls.game,
+            player=cls.player,
             message="Hello, world!",
             is_system=False
         )
@@ -393,69 +669,80 @@ class ChatMessageModelTest(TestCase):
         self.assertTrue(sys_msg.is_system)
         self.assertIsNone(sys_msg.player)
 
+    def test_str_needs_no_extra_queries(self):
+        """Test the default manager joins game and player for __str__"""
+        message = ChatMessage.objects.get(pk=self.message.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(str(message), f"[{self.game.public_id}] testuser: Hello, world!")
+
+    async def test_acreate_system(self):
+        """Test posting a system message from async code"""
+        message = await ChatMessage.acreate_system(self.game, "Auction closed")
+        self.assertTrue(message.is_system)
+        self.assertEqual(await ChatMessage.objects.filter(game=self.game).acount(), 2)
+
+    def test_headers_defer_message(self):
+        """Test headers() leaves the message body unloaded"""
+        header = ChatMessage.objects.headers().get(pk=self.message.pk)
+        self.assertEqual(header.get_deferred_fields(), {"message"})
+
 
 class GameFlowTest(TestCase):
     """Test complete game flow"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create board with tiles
-        self.board = Board.objects.create(name="Test Board", size=10)
+        cls.board = Board.objects.create(name="Test Board", size=10)
         
-        # Create some tiles
-        for i in range(10):
-            tile = Tile.objects.create(
+        # Create some tiles (one INSERT per table)
+        tiles = Tile.objects.bulk_create(
+            Tile(
                 title=f"Tile {i}",
                 tile_type=TileType.CUSTOM if i > 0 else TileType.START  # Changed CITY to CUSTOM
             )
-            BoardTile.objects.create(
-                board=self.board,
-                tile=tile,
-                position=i
-            )
+            for i in range(10)
+        )
+        BoardTile.raw_objects.bulk_create(
+            BoardTile(board=cls.board, tile=tile, position=i)
+            for i, tile in enumerate(tiles)
+        )
         
         # Create users and players
-        self.user1 = User.objects.create_user(username="user1", password="pass123")
-        self.user2 = User.objects.create_user(username="user2", password="pass123")
+        # none of these users log in, so one INSERT without password hashing is enough
+        cls.user1, cls.user2 = User.objects.bulk_create([User(username="user1"), User(username="user2")])
         
-        self.player1 = Player.objects.create(user=self.user1, display_name="Player 1")
-        self.player2 = Player.objects.create(user=self.user2, display_name="Player 2")
+        # Player has no save() hooks or signals, so one INSERT is enough
+        cls.player1, cls.player2 = Player.objects.bulk_create([
+            Player(user=cls.user1, display_name="Player 1"),
+            Player(user=cls.user2, display_name="Player 2"),
+        ])
         
         # Create game
-        self.game = Game.objects.create(
-            board=self.board,
-            owner=self.user1,
+        cls.game = Game.objects.create(
+            board=cls.board,
+            owner=cls.user1,
             name="Test Game",
             max_players=4
         )
 
     def test_game_setup_flow(self):
         """Test setting up a game with players"""
-        # Add players to lobby
-        lobby_player1 = LobbyPlayer.objects.create(
-            game=self.game,
-            player=self.player1,
-            seat_index=0,
-            is_owner=True,
-            is_ready=False
-        )
-        lobby_player2 = LobbyPlayer.objects.create(
-            game=self.game,
-            player=self.player2,
-            seat_index=1,
-            is_ready=False
-        )
+        # Add players to lobby (one INSERT for both seats)
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=self.game, player=self.player1, seat_index=0, is_owner=True, is_ready=False),
+            LobbyPlayer(game=self.game, player=self.player2, seat_index=1, is_ready=False),
+        ])
         
         # Check game cannot start yet
         self.assertFalse(self.game.can_start(self.user1))
         
-        # Mark players as ready
-        lobby_player1.is_ready = True
-        lobby_player1.save()
-        lobby_player2.is_ready = True
-        lobby_player2.save()
+        # Mark players as ready (one UPDATE for the whole lobby)
+        self.game.lobby_players.update(is_ready=True)
         
-        # Now game can start
-        self.assertTrue(self.game.can_start(self.user1))
+        # Now game can start; the seat count is memoized, so this is a single EXISTS
+        with self.assertNumQueries(1):
+            self.assertTrue(self.game.can_start(self.user1))
         
         # Start the game
         self.game.start(self.user1)
@@ -473,6 +760,19 @@ class GameFlowTest(TestCase):
         self.assertIsNotNone(turn)
         self.assertEqual(turn.round_number, 1)
 
+    def test_game_starts_only_once(self):
+        """Test a second, stale instance of the game cannot start it again"""
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=self.game, player=self.player1, seat_index=0, is_owner=True, is_ready=True),
+            LobbyPlayer(game=self.game, player=self.player2, seat_index=1, is_ready=True),
+        ])
+        stale = Game.objects.get(pk=self.game.pk)
+        self.game.start(self.user1)
+        with self.assertRaises(ValueError):
+            stale.start(self.user1)
+        self.assertEqual(stale.status, GameStatus.LOBBY)
+        self.assertEqual(Turn.objects.filter(game=self.game).count(), 1)
+
     def test_game_cannot_start_without_enough_players(self):
         """Test that game cannot start with only one player"""
         LobbyPlayer.objects.create(
@@ -487,49 +787,92 @@ class GameFlowTest(TestCase):
 
     def test_non_owner_cannot_start_game(self):
         """Test that non-owner cannot start game"""
-        LobbyPlayer.objects.create(
-            game=self.game,
-            player=self.player1,
-            seat_index=0,
-            is_owner=True,
-            is_ready=True
-        )
-        LobbyPlayer.objects.create(
-            game=self.game,
-            player=self.player2,
-            seat_index=1,
-            is_ready=True
-        )
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=self.game, player=self.player1, seat_index=0, is_owner=True, is_ready=True),
+            LobbyPlayer(game=self.game, player=self.player2, seat_index=1, is_ready=True),
+        ])
         
         # user2 is not the owner
         self.assertFalse(self.game.can_start(self.user2))
 
+    def test_can_start_query_count(self):
+        """Test that the readiness check is a COUNT plus one EXISTS"""
+        LobbyPlayer.bulk_initialize(self.game, [self.player1, self.player2], is_ready=True)
+        with self.assertNumQueries(2):
+            self.assertTrue(self.game.can_start(self.user1))
+        # the seat count is memoized, so a repeated check only re-runs the EXISTS
+        with self.assertNumQueries(1):
+            self.assertTrue(self.game.can_start(self.user1))
+
+    def test_poll_can_start(self):
+        """Test the polled readiness check is one aggregate that follows any seat write"""
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=self.game, player=self.player1, seat_index=0, is_ready=True),
+            LobbyPlayer(game=self.game, player=self.player2, seat_index=1, is_ready=False),
+        ])
+        self.assertFalse(self.game.poll_can_start(self.user1))
+        self.assertFalse(self.game.poll_can_start(self.user2))
+        # a bulk UPDATE that leaves updated_at alone is picked up as well
+        self.game.lobby_players.update(is_ready=True)
+        with self.assertNumQueries(1):
+            self.assertTrue(self.game.poll_can_start(self.user1))
+
+    def test_lobby_helpers_use_prefetched_players(self):
+        """Test that prefetched lobby players answer the lobby helpers without queries"""
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=self.game, player=self.player1, seat_index=0, is_ready=True),
+            LobbyPlayer(game=self.game, player=self.player2, seat_index=1, is_ready=False),
+        ])
+        game = Game.objects.prefetch_related(
+            Prefetch("lobby_players", queryset=LobbyPlayer.ready_objects.all())
+        ).get(pk=self.game.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(game.get_active_players_count(), 2)
+            self.assertFalse(game.is_full())
+            self.assertFalse(game.all_players_ready())
+            self.assertFalse(game.can_start(self.user1))
+
+    def test_finish_game(self):
+        """Test finishing a started game, and that it only finishes once"""
+        self.assertFalse(self.game.finish())  # still in lobby
+        Game.objects.filter(pk=self.game.pk).update(status=GameStatus.ACTIVE)
+        self.assertTrue(self.game.finish())
+        self.assertEqual(self.game.status, GameStatus.FINISHED)
+        self.assertIsNotNone(self.game.finished_at)
+        self.assertFalse(self.game.finish())
+
     def test_initialize_board_state(self):
         """Test that initialize_board_state creates correct states"""
-        self.game.initialize_board_state()
+        # already-initialized check, BoardPosition ids (none on this legacy board),
+        # BoardTile ids, then one bulk INSERT
+        with self.assertNumQueries(4):
+            self.game.initialize_board_state()
         
-        states = GameBoardTileState.objects.filter(game=self.game)
-        self.assertEqual(states.count(), 10)
+        # one SELECT for both the count and the positions
+        positions = list(GameBoardTileState.objects.filter(game=self.game).values_list("position", flat=True))
+        self.assertEqual(len(positions), 10)
         
         # Check positions are correct
-        positions = set(state.position for state in states)
-        self.assertEqual(positions, set(range(10)))
+        self.assertEqual(set(positions), set(range(10)))
         
-        # Check no double initialization
-        initial_count = states.count()
-        self.game.initialize_board_state()
-        self.assertEqual(GameBoardTileState.objects.filter(game=self.game).count(), initial_count)
+        # Check no double initialization (stops at the existence check)
+        with self.assertNumQueries(1):
+            self.game.initialize_board_state()
+        self.assertEqual(GameBoardTileState.objects.filter(game=self.game).count(), len(positions))
 
 
 class BoardPositionModelTest(TestCase):
     """Test the new BoardPosition model"""
     
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.tile = Tile.objects.create(title="GO", tile_type=TileType.START)
-        self.city_tile = Tile.objects.create(title="Park Place", tile_type=TileType.CUSTOM)
-        self.city = City.objects.create(
-            tile=self.city_tile,
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(name="Test Board", size=10)
+        cls.tile, cls.city_tile = Tile.objects.bulk_create([
+            Tile(title="GO", tile_type=TileType.START),
+            Tile(title="Park Place", tile_type=TileType.CUSTOM),
+        ])
+        cls.city = City.objects.create(
+            tile=cls.city_tile,
             base_price=350,
             rent_base=35
         )
@@ -583,86 +926,124 @@ class BoardPositionModelTest(TestCase):
             position=0,
             tile=self.tile
         )
-        with self.assertRaises(Exception):
+        # full_clean() in save() catches the duplicate before the INSERT is sent
+        with self.assertRaises(ValidationError):
             BoardPosition.objects.create(
                 board=self.board,
                 position=0,
                 city=self.city
             )
 
+    def test_generate_tiles(self):
+        """Test Board.generate_tiles creates tiles and positions in bulk"""
+        positions = self.board.generate_tiles([
+            {"position": i, "title": f"Tile {i}", "tile_type": TileType.CHANCE}
+            for i in range(1, 4)
+        ])
+        self.assertEqual([bp.position for bp in positions], [1, 2, 3])
+        self.assertEqual(
+            list(BoardPosition.objects.filter(board=self.board).values_list("tile__title", flat=True)),
+            ["Tile 1", "Tile 2", "Tile 3"],
+        )
+
+    def test_generate_tiles_out_of_range(self):
+        """Test Board.generate_tiles rejects positions off the board"""
+        with self.assertRaises(ValidationError):
+            self.board.generate_tiles([{"position": 100, "title": "Nowhere"}])
+
     def test_board_position_str(self):
         """Test BoardPosition string representation"""
-        bp = BoardPosition.objects.create(
+        # __str__ only reads the related objects, so an unsaved instance is enough
+        bp = BoardPosition(
             board=self.board,
             position=0,
             tile=self.tile
         )
-        self.assertIn("Test Board", str(bp))
-        self.assertIn("GO", str(bp))
-        self.assertIn("0", str(bp))
+        self.assertEqual(str(bp), "Test Board @ 0 -> GO")
 
 
 class BoardInitializationTest(TestCase):
     """Test board auto-initialization functionality"""
     
-    def test_board_auto_initializes_on_creation(self):
-        """Test that board positions are auto-created when board is created"""
-        board = Board.objects.create(name="Auto Board", size=5)
+    @classmethod
+    def setUpTestData(cls):
+        # One initialized board shared by the class
+        cls.board = Board.objects.create(name="Auto Board", size=5)
         
         # Manually call initialize_positions since signal uses on_commit
         # which doesn't fire in test transactions
-        board.initialize_positions()
+        cls.board.initialize_positions()
+    
+    def test_board_auto_initializes_on_creation(self):
+        """Test that board positions are auto-created when board is created"""
+        board = self.board
         
         # Check that special positions were created
         special_pos = board.default_special_positions()
         
-        # Check special positions exist
-        for name, pos in special_pos.items():
-            bp = BoardPosition.objects.filter(board=board, position=pos).first()
-            self.assertIsNotNone(
-                bp, 
-                f"Special position {name} at {pos} should be auto-created"
-            )
-            self.assertIsNotNone(bp.tile, f"Special position {name} should have a tile")
+        # Check special positions exist (fetched in one query, tiles joined)
+        with self.assertNumQueries(1):
+            positions = {
+                bp.position: bp
+                for bp in BoardPosition.objects.filter(
+                    board=board, position__in=special_pos.values()
+                ).select_related("tile")
+            }
+            for name, pos in special_pos.items():
+                bp = positions.get(pos)
+                self.assertIsNotNone(
+                    bp, 
+                    f"Special position {name} at {pos} should be auto-created"
+                )
+                self.assertIsNotNone(bp.tile, f"Special position {name} should have a tile")
+
+    def test_board_save_initializes_positions_on_commit(self):
+        """Test the post_save hook initializes positions once the transaction commits"""
+        from . import models
+        # running the hooks also fills the canonical tile cache with rows this test rolls back
+        self.addCleanup(models._canonical_cache.clear)
+        # captureOnCommitCallbacks runs the hook inside TestCase; no TransactionTestCase needed
+        with self.captureOnCommitCallbacks(execute=True):
+            board = Board.objects.create(name="Committed Board", size=5)
+        self.assertTrue(BoardPosition.objects.filter(board=board, position=0).exists())
 
     def test_initialize_positions_idempotent(self):
         """Test that initialize_positions can be called multiple times safely"""
-        board = Board.objects.create(name="Test Board", size=5)
+        board = self.board
         
-        # Call initialize_positions multiple times
-        board.initialize_positions()
+        # Call initialize_positions again on the already-initialized board
         board.initialize_positions()
         board.initialize_positions()
         
         # Check that we don't have duplicate positions
-        positions = BoardPosition.objects.filter(board=board)
-        position_values = [p.position for p in positions]
+        position_values = list(BoardPosition.objects.filter(board=board).values_list("position", flat=True))
         
         # No duplicates
         self.assertEqual(len(position_values), len(set(position_values)))
 
     def test_initialize_positions_special_tiles(self):
         """Test that special positions get correct tile types"""
-        board = Board.objects.create(name="Test Board", size=5)
-        board.initialize_positions()
-        
+        board = self.board
         special_pos = board.default_special_positions()
         
+        # Tile types of the four special positions, in one query
+        tile_types = dict(
+            BoardPosition.objects.filter(
+                board=board, position__in=special_pos.values()
+            ).values_list("position", "tile__tile_type")
+        )
+        
         # Check START tile
-        start_bp = BoardPosition.objects.get(board=board, position=special_pos["start"])
-        self.assertEqual(start_bp.tile.tile_type, TileType.START)
+        self.assertEqual(tile_types[special_pos["start"]], TileType.START)
         
         # Check JAIL tile
-        prison_bp = BoardPosition.objects.get(board=board, position=special_pos["prison"])
-        self.assertEqual(prison_bp.tile.tile_type, TileType.JAIL)
+        self.assertEqual(tile_types[special_pos["prison"]], TileType.JAIL)
         
         # Check VACATION tile
-        vacation_bp = BoardPosition.objects.get(board=board, position=special_pos["vacation"])
-        self.assertEqual(vacation_bp.tile.tile_type, TileType.VACATION)
+        self.assertEqual(tile_types[special_pos["vacation"]], TileType.VACATION)
         
         # Check GO_TO_JAIL tile
-        go_to_prison_bp = BoardPosition.objects.get(board=board, position=special_pos["go_to_prison"])
-        self.assertEqual(go_to_prison_bp.tile.tile_type, TileType.GO_TO_JAIL)
+        self.assertEqual(tile_types[special_pos["go_to_prison"]], TileType.GO_TO_JAIL)
 
     def test_initialize_positions_does_not_overwrite_custom(self):
         """Test that initialize_positions doesn't overwrite existing positions"""
@@ -685,34 +1066,36 @@ class BoardInitializationTest(TestCase):
         self.assertEqual(bp.tile.tile_type, TileType.CUSTOM)
 
 
-class TileTypeTest(TestCase):
+class TileTypeTest(SimpleTestCase):
     """Test that TileType.CITY has been removed"""
     
+    # stored values, built once for the class
+    TILE_TYPES = frozenset(TileType.values)
+    
     def test_city_not_in_tile_type(self):
         """Test that CITY is no longer a valid TileType"""
-        tile_types = [choice[0] for choice in TileType.choices]
-        self.assertNotIn("CITY", tile_types)
+        self.assertNotIn("CITY", self.TILE_TYPES)
     
     def test_vacation_in_tile_type(self):
         """Test that VACATION was added to TileType"""
-        tile_types = [choice[0] for choice in TileType.choices]
-        self.assertIn("VACATION", tile_types)
+        self.assertIn("VACATION", self.TILE_TYPES)
 
 
 class GameBoardTileStateNewSchemaTest(TestCase):
     """Test GameBoardTileState works with new BoardPosition schema"""
     
-    def setUp(self):
-        self.board = Board.objects.create(name="Test Board", size=5)
-        self.tile = Tile.objects.create(title="Property", tile_type=TileType.CUSTOM)
-        self.board_position = BoardPosition.objects.create(
-            board=self.board,
+    @classmethod
+    def setUpTestData(cls):
+        cls.board = Board.objects.create(name="Test Board", size=5)
+        cls.tile = Tile.objects.create(title="Property", tile_type=TileType.CUSTOM)
+        cls.board_position = BoardPosition.objects.create(
+            board=cls.board,
             position=5,
-            tile=self.tile
+            tile=cls.tile
         )
-        self.user = User.objects.create_user(username="testuser", password="pass123")
-        self.game = Game.objects.create(board=self.board, owner=self.user)
-        self.player = Player.objects.create(display_name="Test Player")
+        cls.user = User.objects.create_user(username="testuser")
+        cls.game = Game.objects.create(board=cls.board, owner=cls.user)
+        cls.player = Player.objects.create(display_name="Test Player")
 
     def test_tile_state_with_board_position(self):
         """Test creating GameBoardTileState with BoardPosition"""
@@ -729,42 +1112,44 @@ class GameBoardTileStateNewSchemaTest(TestCase):
 
     def test_initialize_board_state_with_positions(self):
         """Test that initialize_board_state works with BoardPosition"""
-        # Note: setUp already creates a position at 5
+        # Note: setUpTestData already creates a position at 5
         # Create some more board positions (within valid range for size 5)
         # size 5 means positions 0-24 are valid
-        for i in range(5):
-            tile = Tile.objects.create(title=f"Tile {i}", tile_type=TileType.CUSTOM)
-            BoardPosition.objects.create(board=self.board, position=i, tile=tile)
+        self.board.generate_tiles([
+            {"position": i, "title": f"Tile {i}", "tile_type": TileType.CUSTOM}
+            for i in range(5)
+        ])
         
-        # Initialize game board state
-        self.game.initialize_board_state()
+        # Initialize game board state: existence check, position ids, one bulk INSERT
+        with self.assertNumQueries(3):
+            self.game.initialize_board_state()
         
         # Check that states were created with board_position references
-        # We expect 6 states: 5 from the loop above + 1 from setUp (position 5)
-        states = GameBoardTileState.objects.filter(game=self.game)
-        self.assertEqual(states.count(), 6)
+        # We expect 6 states: 5 from the loop above + 1 from setUpTestData (position 5)
+        states = GameBoardTileState.objects.filter(game=self.game).order_by("position")
+        self.assertEqual(list(states.values_list("position", flat=True)), list(range(6)))
         
-        for state in states:
-            self.assertIsNotNone(state.board_position)
-            self.assertIsNone(state.board_tile)  # Should not use legacy field
+        # Should reference positions, not the legacy field
+        self.assertFalse(states.filter(board_position__isnull=True).exists())
+        self.assertFalse(states.filter(board_tile__isnull=False).exists())
 
 
 class GameModeAndJoinTest(TestCase):
     """Test game mode filtering and join functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create users
-        self.user1 = User.objects.create_user(username='user1', password='pass123')
-        self.user2 = User.objects.create_user(username='user2', password='pass123')
-        self.user3 = User.objects.create_user(username='user3', password='pass123')
+        cls.user1, cls.user2, cls.user3 = User.objects.bulk_create(
+            [User(username=f'user{i}') for i in (1, 2, 3)]
+        )
         
-        # Create board
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.board.initialize_positions()
+        # Create board (no test here reads its positions, so they are not initialized)
+        cls.board = Board.objects.create(name="Test Board", size=10)
         
         # Import GameMode here to avoid issues if it wasn't imported at top
         from .models import GameMode
-        self.GameMode = GameMode
+        cls.GameMode = GameMode
         
     def test_game_mode_default(self):
         """Test that game mode defaults to ONLINE"""
@@ -777,14 +1162,16 @@ class GameModeAndJoinTest(TestCase):
     
     def test_game_mode_choices(self):
         """Test all game mode choices can be set"""
-        for mode in [self.GameMode.SOLO, self.GameMode.FRIENDS, self.GameMode.ONLINE]:
-            game = Game.objects.create(
-                name=f"Game {mode}",
-                owner=self.user1,
-                board=self.board,
-                mode=mode
-            )
-            self.assertEqual(game.mode, mode)
+        modes = [self.GameMode.SOLO, self.GameMode.FRIENDS, self.GameMode.ONLINE]
+        # one INSERT for all three games, one SELECT to read the stored modes back
+        games = Game.objects.bulk_create([
+            Game(name=f"Game {mode}", owner=self.user1, board=self.board, mode=mode)
+            for mode in modes
+        ])
+        stored = dict(Game.objects.filter(pk__in=[g.pk for g in games]).values_list("name", "mode"))
+        for mode in modes:
+            with self.subTest(mode=mode):
+                self.assertEqual(stored[f"Game {mode}"], mode)
     
     def test_get_active_players_count(self):
         """Test get_active_players_count method"""
@@ -829,6 +1216,26 @@ class GameModeAndJoinTest(TestCase):
         LobbyPlayer.objects.create(game=game, player=player2, seat_index=1)
         self.assertTrue(game.is_full())
     
+    def test_active_players_count_memoized(self):
+        """Test the seat count is computed once per instance and refreshed on change"""
+        game = Game.objects.create(name="Test Game", owner=self.user1, board=self.board, max_players=2)
+        self.assertEqual(game.get_active_players_count(), 0)
+        with self.assertNumQueries(0):
+            self.assertFalse(game.is_full())
+        player1 = Player.objects.create(user=self.user1, display_name='Player1')
+        LobbyPlayer.objects.create(game=game, player=player1, seat_index=0)
+        self.assertEqual(game.get_active_players_count(), 1)
+
+    def test_active_players_count_annotated(self):
+        """Test an annotated seat count answers the lobby helpers without queries"""
+        game = Game.objects.create(name="Test Game", owner=self.user1, board=self.board, max_players=1)
+        player1 = Player.objects.create(user=self.user1, display_name='Player1')
+        LobbyPlayer.objects.create(game=game, player=player1, seat_index=0)
+        annotated = Game.objects.annotate(active_players_count=Count("lobby_players")).get(pk=game.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.get_active_players_count(), 1)
+            self.assertTrue(annotated.is_full())
+
     def test_can_user_join_lobby_status(self):
         """Test can_user_join with different game statuses"""
         game = Game.objects.create(
@@ -843,7 +1250,7 @@ class GameModeAndJoinTest(TestCase):
         
         # User cannot join active game
         game.status = GameStatus.ACTIVE
-        game.save()
+        game.save(update_fields=["status"])
         self.assertFalse(game.can_user_join(self.user2))
     
     def test_can_user_join_full_game(self):
@@ -892,124 +1299,210 @@ class GameModeAndJoinTest(TestCase):
 class GameLobbyViewTest(TestCase):
     """Test game lobby view filtering"""
     
-    def setUp(self):
-        from django.test import Client
+    @classmethod
+    def setUpTestData(cls):
         from .models import GameMode
         
-        self.client = Client()
-        self.user = User.objects.create_user(username='testuser', password='pass123')
-        
-        # Create board
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.board.initialize_positions()
-        
-        # Create games with different modes
-        self.online_game = Game.objects.create(
-            name="Online Game",
-            owner=self.user,
-            board=self.board,
-            mode=GameMode.ONLINE,
-            status=GameStatus.LOBBY
-        )
-        
-        self.friends_game = Game.objects.create(
-            name="Friends Game",
-            owner=self.user,
-            board=self.board,
-            mode=GameMode.FRIENDS,
-            status=GameStatus.LOBBY
-        )
-        
-        self.solo_game = Game.objects.create(
-            name="Solo Game",
-            owner=self.user,
-            board=self.board,
-            mode=GameMode.SOLO,
-            status=GameStatus.LOBBY
-        )
-        
-        self.active_game = Game.objects.create(
-            name="Active Online Game",
-            owner=self.user,
-            board=self.board,
-            mode=GameMode.ONLINE,
-            status=GameStatus.ACTIVE
-        )
+        cls.user = User.objects.create_user(username='testuser')
+        
+        # Create board (the views under test never read its positions)
+        cls.board = Board.objects.create(name="Test Board", size=10)
+        
+        # Create games with different modes (one INSERT; Game has no save() hooks)
+        cls.online_game, cls.friends_game, cls.solo_game, cls.active_game = Game.objects.bulk_create([
+            Game(name="Online Game", owner=cls.user, board=cls.board,
+                 mode=GameMode.ONLINE, status=GameStatus.LOBBY),
+            Game(name="Friends Game", owner=cls.user, board=cls.board,
+                 mode=GameMode.FRIENDS, status=GameStatus.LOBBY),
+            Game(name="Solo Game", owner=cls.user, board=cls.board,
+                 mode=GameMode.SOLO, status=GameStatus.LOBBY),
+            Game(name="Active Online Game", owner=cls.user, board=cls.board,
+                 mode=GameMode.ONLINE, status=GameStatus.ACTIVE),
+        ])
     
     def test_lobby_shows_only_online_lobby_games(self):
         """Test that lobby view only shows ONLINE games in LOBBY status"""
-        response = self.client.get('/game/')
+        # the games, with board joined and seat count annotated
+        with self.assertNumQueries(1):
+            response = self.client.get('/game/')
         self.assertEqual(response.status_code, 200)
         
         # Check that only online lobby game appears
         games = response.context['games']
-        self.assertEqual(games.count(), 1)
+        self.assertEqual(len(games), 1)
         self.assertEqual(games[0].name, "Online Game")
     
     def test_lobby_hides_friends_games(self):
         """Test that FRIENDS games don't appear in public lobby"""
         response = self.client.get('/game/')
-        content = response.content.decode('utf-8')
         
         # Online game should be visible
-        self.assertIn("Online Game", content)
+        self.assertContains(response, "Online Game")
         
         # Friends game should NOT be visible
-        self.assertNotIn("Friends Game", content)
+        self.assertNotContains(response, "Friends Game")
     
+    def test_lobby_query_count(self):
+        """Test the lobby renders with a fixed number of queries"""
+        # a single query (board joined, seat count annotated), however many games are listed
+        games = Game.objects.bulk_create([
+            Game(name=f"Extra {i}", owner=self.user, board=self.board) for i in range(3)
+        ])
+        players = Player.objects.bulk_create([Player(display_name=f"Extra {i}") for i in range(3)])
+        LobbyPlayer.objects.bulk_create([
+            LobbyPlayer(game=game, player=player, seat_index=0) for game, player in zip(games, players)
+        ])
+        with self.assertNumQueries(1):
+            response = self.client.get('/game/')
+        self.assertContains(response, "1/6")
+
+    def test_lobby_pagination(self):
+        """Test the lobby pages through games without counting them all"""
+        from .views import LOBBY_PAGE_SIZE
+        Game.objects.bulk_create([
+            Game(name=f"Extra {i}", owner=self.user, board=self.board) for i in range(LOBBY_PAGE_SIZE)
+        ])
+        # one row past the page answers has_next, so still a single query
+        with self.assertNumQueries(1):
+            response = self.client.get('/game/')
+        self.assertEqual(len(response.context['games']), LOBBY_PAGE_SIZE)
+        self.assertTrue(response.context['has_next'])
+        self.assertContains(response, '?page=2')
+        
+        response = self.client.get('/game/', {'page': 2})
+        self.assertEqual(len(response.context['games']), 1)
+        self.assertFalse(response.context['has_next'])
+        self.assertTrue(response.context['has_previous'])
+        
+        # junk page numbers fall back to the first page
+        response = self.client.get('/game/', {'page': 'x'})
+        self.assertEqual(response.context['page'], 1)
+
+    def test_lobby_page_out_of_range(self):
+        """Test huge or empty lobby pages render with a link back instead of failing"""
+        from .views import LOBBY_MAX_PAGE
+        response = self.client.get('/game/', {'page': '9' * 23})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['page'], LOBBY_MAX_PAGE)
+        
+        response = self.client.get('/game/', {'page': 3})
+        self.assertEqual(response.context['games'], [])
+        self.assertContains(response, 'No games on this page.')
+        self.assertContains(response, '?page=2')
+
+    def test_lobby_board_list_cached(self):
+        """Test the board picker is cached after commit and refreshed when a board changes"""
+        from django.core.cache import cache
+        from .models import LOBBY_BOARDS_CACHE_KEY
+        self.addCleanup(cache.delete, LOBBY_BOARDS_CACHE_KEY)
+        self.client.force_login(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get('/game/')
+        # session, user and games; the boards come from the cache
+        with self.assertNumQueries(3):
+            response = self.client.get('/game/')
+        self.assertEqual(response.context['boards'], [self.board])
+        Board.objects.create(name="Another Board", size=5)
+        response = self.client.get('/game/')
+        self.assertEqual([b.name for b in response.context['boards']], ["Another Board", "Test Board"])
+
     def test_join_button_appears_for_authenticated_user(self):
         """Test that Join Game button appears for logged-in users"""
-        self.client.login(username='testuser', password='pass123')
-        response = self.client.get('/game/')
-        content = response.content.decode('utf-8')
+        self.client.force_login(self.user)
+        # session and user lookups, the games and the board picker
+        with self.assertNumQueries(4):
+            response = self.client.get('/game/')
         
         # Join Game button should appear
-        self.assertIn("Join Game", content)
+        self.assertContains(response, "Join Game")
 
 
-class JoinGameViewTest(TestCase):
+class JoinGameViewTest(GameFixtureMixin, TestCase):
     """Test join game functionality"""
     
-    def setUp(self):
-        from django.test import Client
-        
-        self.client = Client()
-        self.user1 = User.objects.create_user(username='user1', password='pass123')
-        self.user2 = User.objects.create_user(username='user2', password='pass123')
-        
-        # Create board
-        self.board = Board.objects.create(name="Test Board", size=10)
-        self.board.initialize_positions()
-        
-        # Create game
-        self.game = Game.objects.create(
-            name="Test Game",
-            owner=self.user1,
-            board=self.board,
-            status=GameStatus.LOBBY
-        )
+    @classmethod
+    def setUpTestData(cls):
+        # board, owner, lobby game and the owner's player come from the mixin
+        super().setUpTestData()
+        cls.user2 = User.objects.create_user(username='user2')
         
         # Add owner to game
-        player1 = Player.objects.create(user=self.user1, display_name='User1')
-        LobbyPlayer.objects.create(game=self.game, player=player1, seat_index=0, is_owner=True)
+        LobbyPlayer.objects.create(game=cls.game, player=cls.player, seat_index=0, is_owner=True)
     
     def test_join_game_success(self):
         """Test successful game join"""
-        self.client.login(username='user2', password='pass123')
+        self.client.force_login(self.user2)
         
         # Count players before join
-        initial_count = self.game.get_active_players_count()
+        initial_count = LobbyPlayer.objects.filter(game=self.game).count()
         
         # Join game
-        response = self.client.get(f'/game/{self.game.id}/join/', follow=True)
-        
-        # Should redirect to game detail
-        self.assertEqual(response.status_code, 200)
-        
-        # Check player was added
-        self.game.refresh_from_db()
-        self.assertEqual(self.game.get_active_players_count(), initial_count + 1)
+        # session, user, then inside the join's savepoint: locked game, join check (seat
+        # COUNT + membership EXISTS), the user's Player (made at signup), highest seat,
+        # seat INSERT
+        with self.assertNumQueries(10):
+            response = self.client.get(f'/game/{self.game.id}/join/')
+        
+        # Should redirect to game detail (which renders with a 200)
+        self.assertRedirects(response, f'/game/{self.game.id}/')
+        
+        # Check player was added (only the seat count changed, so no Game re-read)
+        self.assertEqual(LobbyPlayer.objects.filter(game=self.game).count(), initial_count + 1)
+        # seated after the owner's seat 0
+        self.assertEqual(LobbyPlayer.objects.get(game=self.game, player__user=self.user2).seat_index, 1)
     
+    def test_game_detail_query_count(self):
+        """Test the game detail page renders with a fixed number of queries"""
+        # called directly through RequestFactory: no middleware, sessions or auth lookups
+        from django.contrib.auth.models import AnonymousUser
+        from django.test import RequestFactory
+        from .views import game_detail
+        request = RequestFactory().get(f'/game/{self.game.id}/')
+        request.user = AnonymousUser()
+        # the game and its seated players (joined to Player)
+        with self.assertNumQueries(2):
+            response = game_detail(request, self.game.id)
+        self.assertEqual(response.status_code, 200)
+
+    def test_game_detail_finds_current_player_from_seats(self):
+        """Test the signed-in user's seat is picked out of the loaded seats"""
+        self.client.force_login(self.user)
+        # session, user, the game and its seated players; no separate Player lookup
+        with self.assertNumQueries(4):
+            response = self.client.get(f'/game/{self.game.id}/')
+        self.assertEqual(response.context['current_player'].player, self.player)
+        game = response.context['game']
+        self.assertEqual(game.get_deferred_fields(), {'state'})
+        with self.assertNumQueries(0):
+            self.assertEqual(game.get_active_players_count(), 1)
+            self.assertFalse(game.all_players_ready())
+
+    def test_game_detail_query_count_independent_of_players(self):
+        """Test the game detail page doesn't issue a query per seated player"""
+        seated = 1
+        for n_players in (2, 5, 10):
+            with self.subTest(n_players=n_players):
+                players = Player.objects.bulk_create([
+                    Player(display_name=f"Extra {seated + i}") for i in range(n_players - seated)
+                ])
+                LobbyPlayer.bulk_initialize(self.game, players)
+                seated = n_players
+                with self.assertNumQueries(2):
+                    response = self.client.get(f'/game/{self.game.id}/')
+                self.assertEqual(len(response.context['players']), n_players)
+
+    def test_create_game(self):
+        """Test creating a game seats the owner"""
+        self.client.force_login(self.user2)
+        self.client.post('/game/create/', {'game_name': 'New Game', 'board_id': self.board.id})
+        game = Game.objects.prefetch_related(
+            Prefetch('lobby_players', queryset=LobbyPlayer.objects.select_related('player'))
+        ).get(name='New Game')
+        with self.assertNumQueries(0):
+            seat = next((lp for lp in game.lobby_players.all() if lp.player.user_id == self.user2.id), None)
+        self.assertIsNotNone(seat)
+        self.assertTrue(seat.is_owner)
+
     def test_join_game_requires_login(self):
         """Test that joining requires authentication"""
         response = self.client.get(f'/game/{self.game.id}/join/')
@@ -1017,3 +1510,92 @@ class JoinGameViewTest(TestCase):
         # Should redirect to login
         self.assertEqual(response.status_code, 302)
         self.assertIn('/users/login/', response.url)
+
+
+class CanonicalTileCacheTest(TestCase):
+    """Test the in-process cache of canonical special tiles"""
+
+    def setUp(self):
+        from . import models
+        self.cache = models._canonical_cache
+        self.cache.clear()
+        self.addCleanup(self.cache.clear)
+
+    def test_cache_filled_after_commit(self):
+        """Test canonical tiles are cached once the transaction commits"""
+        from .models import get_canonical_special_tiles
+        with self.captureOnCommitCallbacks(execute=True):
+            tiles = get_canonical_special_tiles(prison_position=9)
+        self.assertEqual(set(self.cache), {"start", "prison", "vacation", "go_to_prison"})
+        with self.assertNumQueries(0):
+            self.assertEqual(get_canonical_special_tiles(), tiles)
+
+    def test_cache_cleared_on_special_tile_save(self):
+        """Test saving a special tile invalidates the cache"""
+        from .models import get_canonical_special_tiles
+        with self.captureOnCommitCallbacks(execute=True):
+            tiles = get_canonical_special_tiles()
+        tiles["start"].description = "Changed"
+        tiles["start"].save()
+        self.assertEqual(self.cache, {})
+
+
+class DataMigrationTest(TestCase):
+    """
+    The test database is built from the models, so data migrations never run as part of
+    the suite. Call their RunPython functions with the historical models instead.
+    """
+
+    def run_backfill(self, migration, function):
+        import importlib
+        from django.db import connection
+        from django.db.migrations.executor import MigrationExecutor
+        state = MigrationExecutor(connection).loader.project_state(("game", migration))
+        getattr(importlib.import_module(f"game.migrations.{migration}"), function)(state.apps, None)
+
+    def test_backfill_current_rent(self):
+        """Test 0005 fills current_rent on owned, unmortgaged tile states"""
+        board = Board.objects.create(name="Test Board", size=10)
+        game = Game.objects.create(board=board, name="Test Game")
+        tile, board_tile = create_property_tile(board, position=5)
+        City.objects.create(tile=tile)
+        player = Player.objects.create(display_name="Owner")
+        owned, mortgaged = GameBoardTileState.objects.bulk_create([
+            GameBoardTileState(game=game, board_tile=board_tile, position=5, owner=player, houses=1),
+            GameBoardTileState(game=game, board_tile=board_tile, position=6, owner=player, mortgaged=True),
+        ])
+        self.run_backfill("0005_gameboardtilestate_current_rent", "backfill_current_rent")
+        rents = dict(GameBoardTileState.objects.values_list("pk", "current_rent"))
+        self.assertEqual(rents, {owned.pk: 50, mortgaged.pk: 0})
+
+    def test_backfill_user_players(self):
+        """Test 0013 gives every user without a Player exactly one"""
+        signed_up = User.objects.create_user(username="signed_up")
+        imported, = User.objects.bulk_create([User(username="imported")])
+        self.run_backfill("0013_backfill_user_players", "backfill_user_players")
+        counts = dict(
+            User.objects.filter(pk__in=[signed_up.pk, imported.pk])
+            .annotate(n=Count("player")).values_list("username", "n")
+        )
+        self.assertEqual(counts, {"signed_up": 1, "imported": 1})
+        self.assertEqual(Player.objects.get(user=imported).display_name, "imported")
+
+
+class TestSuiteLayoutTest(SimpleTestCase):
+    """Guard the fast per-test rollback path for the database tests in the project"""
+
+    # TransactionTestCase classes that really need table flushing, by dotted path
+    FLUSH_ALLOWED = set()
+
+    def test_database_tests_use_testcase(self):
+        """Test every TransactionTestCase in the test modules is a TestCase (rollback), not a flushing one"""
+        import importlib
+        import inspect
+        for module_name in ("game.tests", "users.tests"):
+            module = importlib.import_module(module_name)
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__ or not issubclass(cls, TransactionTestCase):
+                    continue
+                path = f"{module_name}.{name}"
+                with self.subTest(test_class=path):
+                    self.assertTrue(issubclass(cls, TestCase) or path in self.FLUSH_ALLOWED)
@@ -1,26 +1,49 @@
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import JsonResponse
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from .models import Game, Board, Player, LobbyPlayer, GameStatus, GameMode
+from django.db import transaction
+from django.db.models import Count, Max, Prefetch
+from .models import Game, Board, Player, LobbyPlayer, GameStatus, GameMode, get_lobby_boards
 
-# Placeholder views during model migration
-# TODO: Update views to work with new model structure
+# Games listed per lobby page
+LOBBY_PAGE_SIZE = 20
+# Higher page numbers are clamped, keeping the OFFSET within the database's integer range
+LOBBY_MAX_PAGE = 1000
 
 def game_lobby(request):
     """Display all available games and allow creating new ones."""
     # Only show ONLINE games in the public lobby
     # FRIENDS games should not be visible here (accessed via direct links)
+    # The listing never shows the serialized state JSON, so it isn't fetched
+    # The seat count is annotated onto each row (it fills Game.active_players_count),
+    # so the player count / is_full cost no extra query per listed game
     games = Game.objects.filter(
         mode=GameMode.ONLINE,
         status=GameStatus.LOBBY
-    ).select_related('board', 'owner').order_by('-created_at')
+    ).select_related('board', 'owner').defer('state').annotate(
+        active_players_count=Count('lobby_players')
+    ).order_by('-created_at')
     
-    boards = Board.objects.all().order_by('name')
+    # One page at a time. Fetching a single extra row tells us whether there is a
+    # next page, so no COUNT(*) over all lobby games is needed (unlike Paginator)
+    try:
+        page = min(max(int(request.GET.get('page', 1)), 1), LOBBY_MAX_PAGE)
+    except ValueError:
+        page = 1
+    offset = (page - 1) * LOBBY_PAGE_SIZE
+    games = list(games[offset:offset + LOBBY_PAGE_SIZE + 1])
+    has_next = len(games) > LOBBY_PAGE_SIZE
+    games = games[:LOBBY_PAGE_SIZE]
+    
+    # The board picker is only shown to signed-in users; its list is cached
+    boards = get_lobby_boards() if request.user.is_authenticated else []
     
     context = {
         'games': games,
         'boards': boards,
+        'page': page,
+        'has_previous': page > 1,
+        'has_next': has_next,
     }
     return render(request, 'game/lobby.html', context)
 
@@ -49,11 +72,8 @@ def create_game(request):
             status=GameStatus.LOBBY
         )
         
-        # Create player for the owner
-        player = Player.objects.create(
-            user=request.user,
-            display_name=request.user.username
-        )
+        # The owner's persistent player (created along with their account)
+        player = Player.for_user(request.user)
         
         # Add owner to lobby
         LobbyPlayer.objects.create(
@@ -71,57 +91,63 @@ def create_game(request):
 @login_required
 def join_game(request, game_id):
     """Join an existing game."""
-    game = get_object_or_404(Game, id=game_id)
-    
-    # Check if user can join
-    if not game.can_user_join(request.user):
-        if game.status != GameStatus.LOBBY:
-            messages.error(request, 'This game has already started.')
-        elif game.is_full():
-            messages.error(request, 'This game is full.')
-        else:
-            messages.error(request, 'You cannot join this game.')
-        return redirect('game:lobby')
-    
-    # Get or create player for this user
-    player, created = Player.objects.get_or_create(
-        user=request.user,
-        defaults={'display_name': request.user.username}
-    )
-    
-    # Find next available seat
-    occupied_seats = set(game.lobby_players.values_list('seat_index', flat=True))
-    next_seat = 0
-    while next_seat in occupied_seats:
-        next_seat += 1
-    
-    # Add player to lobby
-    LobbyPlayer.objects.create(
-        game=game,
-        player=player,
-        seat_index=next_seat,
-        is_owner=False
-    )
+    with transaction.atomic():
+        # Lock the game row so concurrent joins can't both pass the checks below
+        # or be handed the same seat
+        game = get_object_or_404(Game.objects.select_for_update(), id=game_id)
+        
+        # Check if user can join
+        if not game.can_user_join(request.user):
+            if game.status != GameStatus.LOBBY:
+                messages.error(request, 'This game has already started.')
+            elif game.is_full():
+                messages.error(request, 'This game is full.')
+            else:
+                messages.error(request, 'You cannot join this game.')
+            return redirect('game:lobby')
+        
+        # The user's persistent player (created along with their account)
+        player = Player.for_user(request.user)
+        
+        # Next seat goes after the highest occupied one (seats are only ever appended)
+        max_seat = game.lobby_players.aggregate(m=Max('seat_index'))['m']
+        next_seat = 0 if max_seat is None else max_seat + 1
+        
+        # Add player to lobby
+        LobbyPlayer.objects.create(
+            game=game,
+            player=player,
+            seat_index=next_seat,
+            is_owner=False
+        )
     
     messages.success(request, f'You have joined "{game.name}"!')
     return redirect('game:game_detail', game_id=game.id)
 
 def game_detail(request, game_id):
     """Display game detail view."""
-    game = get_object_or_404(Game, id=game_id)
+    # Seats are loaded once (with their Player) as the game's lobby_players prefetch:
+    # the template's player count / readiness helpers and the current user's seat
+    # are all answered from them instead of separate queries. The serialized state
+    # JSON isn't rendered here, so it is left in the database
+    game = get_object_or_404(
+        Game.objects.defer('state').prefetch_related(
+            Prefetch('lobby_players', queryset=LobbyPlayer.objects.select_related('player'))
+        ),
+        id=game_id
+    )
+    players = list(game.lobby_players.all())
     
     # Get current user's player if they're in the game
     current_player = None
     if request.user.is_authenticated:
-        try:
-            player = Player.objects.get(user=request.user)
-            current_player = game.lobby_players.filter(player=player).first()
-        except Player.DoesNotExist:
-            pass
+        current_player = next(
+            (lp for lp in players if lp.player.user_id == request.user.id), None
+        )
     
     context = {
         'game': game,
-        'players': game.lobby_players.select_related('player').all(),
+        'players': players,
         'current_player': current_player,
     }
     return render(request, 'game/game_detail.html', context)
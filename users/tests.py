@@ -1,14 +1,16 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
 from django.urls import reverse
 
 
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class LogoutTestCase(TestCase):
     """Test cases for user logout functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create a test user"""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )